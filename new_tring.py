@@ -1,16 +1,27 @@
+import logging
+import os
 import sys
+from functools import lru_cache
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton, 
                             QGroupBox, QFrame, QGridLayout, QDialog, QScrollArea)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
 import numpy as np
-from scipy.interpolate import interp1d
-from scipy.optimize import fsolve
-import pandas as pd
+from scipy.integrate import trapezoid
+from scipy.linalg import solve_banded
+
+logger = logging.getLogger(__name__)
+
+_plt = None
+
+def _pyplot():
+    """延迟导入matplotlib.pyplot，仅在首次绘图时加载"""
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
 
 class StatusLight(QLabel):
     def __init__(self, parent=None):
@@ -76,27 +87,78 @@ class ImageViewerDialog(QDialog):
         button_layout.addStretch()
         layout.addLayout(button_layout)
         
+        # 拖动调整大小时先快速缩放，停止调整100ms后再平滑缩放
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(100)
+        self._resize_timer.timeout.connect(self._smooth_scale)
+        self._last_scaled_size = None
+        
         # 保存原始图片
         self.original_pixmap = pixmap
         # 初始显示
-        self.resizeEvent(None)
+        self._smooth_scale()
+    
+    def _available_size(self):
+        """获取可用空间大小（减去按钮区域高度）"""
+        available_size = self.size()
+        available_size.setHeight(available_size.height() - 40)  # 40是按钮区域的高度
+        return available_size
+    
+    def _scale_pixmap(self, transformation):
+        """按可用空间缩放图片并更新显示"""
+        available_size = self._available_size()
+        scaled_pixmap = self.original_pixmap.scaled(
+            available_size,
+            Qt.KeepAspectRatio,
+            transformation
+        )
+        self.image_label.setPixmap(scaled_pixmap)
+        self._last_scaled_size = available_size
+    
+    def _smooth_scale(self):
+        """调整大小结束后，使用平滑缩放重新绘制图片"""
+        if not self.original_pixmap.isNull():
+            self._scale_pixmap(Qt.SmoothTransformation)
     
     def resizeEvent(self, event):
         """当窗口大小改变时，调整图片大小"""
         if hasattr(self, 'original_pixmap') and not self.original_pixmap.isNull():
-            # 获取可用空间大小（减去按钮区域高度）
-            available_size = self.size()
-            available_size.setHeight(available_size.height() - 40)  # 40是按钮区域的高度
-            
-            # 计算缩放后的图片大小
-            scaled_pixmap = self.original_pixmap.scaled(
-                available_size,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            
-            # 更新图片
-            self.image_label.setPixmap(scaled_pixmap)
+            # 尺寸未变化时无需重新缩放
+            if self._available_size() == self._last_scaled_size:
+                return
+            
+            # 先快速缩放，保证拖动时界面流畅
+            self._scale_pixmap(Qt.FastTransformation)
+            self._resize_timer.start()
+
+class FigureDialog(QDialog):
+    """非模态分析图窗口，内嵌matplotlib画布，不阻塞Qt事件循环"""
+    def __init__(self, title, figsize, parent=None):
+        super().__init__(parent)
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT
+        
+        self.setWindowTitle(title)
+        self.setWindowFlags(Qt.Window | Qt.WindowMaximizeButtonHint | Qt.WindowCloseButtonHint)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        # 不经过pyplot创建图表，由对话框自行管理
+        self.figure = Figure(figsize=figsize)
+        self.canvas = FigureCanvas(self.figure)
+        # 与pyplot窗口一样提供导航工具栏，支持缩放、平移和保存图片
+        layout.addWidget(NavigationToolbar2QT(self.canvas, self))
+        layout.addWidget(self.canvas)
+    
+    def refresh(self):
+        """调整布局后请求重绘并显示窗口，绘制由Qt合并处理"""
+        self.figure.tight_layout()
+        self.canvas.draw_idle()
+        self.show()
+        self.raise_()
 
 class ClickableImageLabel(QLabel):
     def __init__(self, parent=None):
@@ -108,12 +170,150 @@ class ClickableImageLabel(QLabel):
             dialog = ImageViewerDialog(self.pixmap(), self.window())
             dialog.exec_()
 
+def _solve_temperature(Th, Tc, n_points, J, temps, seebeck_tab, resistivity_tab, thermal_cond_tab, max_iter):
+    """
+    迭代求解格点温度分布的数值核心
+    
+    参数:
+    Th, Tc: 高温端/低温端温度 (K)
+    n_points: 格点数
+    J: 电流密度 (A/m²)
+    temps, seebeck_tab, resistivity_tab, thermal_cond_tab: 按温度排序的材料属性表
+    max_iter: 最大迭代次数
+    
+    返回:
+    T: 各格点温度 (K)
+    """
+    dx = 1.0 / (n_points - 1)  # 标准化长度下的网格间距
+    T = np.linspace(Tc, Th, n_points)  # 初始线性温度分布
+    
+    logger.debug("初始温度分布: %s", T)
+    
+    # 迭代中复用的数组：三对角系数矩阵（带状存储：第0行上对角线，第1行主对角线，第2行下对角线）、
+    # 右端向量和参考算法中的系数
+    ab = np.zeros((3, n_points))
+    b = np.empty(n_points)
+    T_safe = np.empty(n_points)
+    c1, c2, c3, c4, c5 = np.empty((5, n_points))
+    
+    # 开始迭代
+    for iter_count in range(max_iter):
+        # 计算各节点处的材料属性
+        np.clip(T, 300.0, 700.0, out=T_safe)  # 确保温度在有效范围内
+        seebeck = np.interp(T_safe, temps, seebeck_tab)
+        resistivity = np.interp(T_safe, temps, resistivity_tab)
+        thermal_cond = np.interp(T_safe, temps, thermal_cond_tab)
+        
+        # 计算参考算法中的系数
+        np.multiply(seebeck, J, out=c1)
+        np.divide(c1, thermal_cond, out=c1)            # c1 = J·S/κ
+        np.divide(-1.0, thermal_cond, out=c2)          # c2 = -1/κ
+        np.multiply(c1, seebeck, out=c3)
+        np.multiply(c3, J, out=c3)                     # c3 = S²·J²/κ = c1·S·J
+        np.negative(c1, out=c4)                        # c4 = -J·S/κ = -c1
+        np.multiply(resistivity, J * J, out=c5)        # c5 = ρ·J²
+        
+        # 设置边界条件（求解器会覆盖ab和b，每次迭代都需重新写入）
+        ab[0, 1] = 0.0
+        ab[1, 0] = 1.0
+        b[0] = Tc
+        ab[1, n_points-1] = 1.0
+        ab[2, n_points-2] = 0.0
+        b[n_points-1] = Th
+        
+        # 构造内部点(i = 1..n-2)的系数矩阵，使用与参考算法一致的形式
+        ab[2, :-2] = 1 / (c2[1:-1] * dx)
+        ab[1, 1:-1] = c4[2:] / c2[2:] - 1 / (c2[2:] * dx) - (1 - c1[1:-1] * dx) / (c2[1:-1] * dx)
+        ab[0, 2:] = (1 - c1[2:] * dx) / (c2[2:] * dx) - c3[2:] * dx - (1 - c1[2:] * dx) * c4[2:] / c2[2:]
+        b[1:-1] = c5[:-2] * dx
+        
+        # 尝试求解线性方程组（三对角矩阵，O(n)求解）
+        try:
+            # ab和b每次迭代都会重新写入，允许求解器直接复用其内存
+            T_new = solve_banded((1, 1), ab, b, overwrite_ab=True, overwrite_b=True,
+                                 check_finite=False)
+            
+            # 检查解的合理性
+            if np.any(np.isnan(T_new)) or np.any(np.isinf(T_new)):
+                logger.warning("警告：第%d次迭代解不合理，使用线性插值", iter_count+1)
+                T_new = np.linspace(Tc, Th, n_points)
+            
+            # 限制温度在物理合理范围内
+            T_new = np.clip(T_new, min(Tc, Th)*0.95, max(Tc, Th)*1.1)
+            
+            # 计算收敛情况
+            max_change = np.max(np.abs(T_new - T))
+            logger.debug("迭代%d次完成，最大温度变化: %.6fK", iter_count+1, max_change)
+            
+            # 更新温度
+            T = T_new.copy()
+            
+            # 判断是否已经收敛
+            if max_change < 0.01:  # 收敛阈值
+                logger.debug("温度分布已收敛，在第%d次迭代", iter_count+1)
+                break
+                
+        except np.linalg.LinAlgError:
+            logger.warning("警告：线性方程组求解失败，使用线性温度分布")
+            T = np.linspace(Tc, Th, n_points)
+            break
+    
+    return T
+
+def _efficiency_kernel(Th, Tc, T, dx, J, seebeck, resistivity, thermal_cond):
+    """
+    由温度分布和材料属性计算一组电流密度下的效率和功率的数值核心
+    
+    参数:
+    Th, Tc: 高温端/低温端温度 (K)
+    T: 各格点温度 (K)
+    dx: 格点间距
+    J: 电流密度数组 (A/m²)
+    seebeck, resistivity, thermal_cond: 各格点的材料属性
+    
+    返回:
+    efficiencies: 效率数组 (小数)
+    powers: 输出功率密度数组 (W/m²)
+    zero_flux, negative, capped: 热流为零、效率为负、超过卡诺效率被限制的电流密度掩码
+    """
+    # 计算冷端(最后一个格点)热流密度 q，只有它参与效率计算
+    c1 = J * seebeck[-1] / thermal_cond[-1]
+    c2 = -1 / thermal_cond[-1]
+    q_end = ((1/dx - c1) * T[-1] - T[-2]/dx) / c2
+    
+    # 计算积分项，使用梯形法则（与电流密度无关）
+    cumulative_seebeck = trapezoid(seebeck, T)  # 塞贝克积分项
+    cumulative_resistivity = trapezoid(resistivity, dx=dx)  # 电阻率积分项
+    
+    # 计算功率
+    powers = J * (cumulative_seebeck + J * cumulative_resistivity)
+    
+    # 计算效率，热流为零时效率记为0
+    zero_flux = q_end == 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efficiencies = np.where(zero_flux, 0.0, powers / q_end)
+    
+    # 负效率设为0
+    negative = efficiencies < 0
+    efficiencies[negative] = 0.0
+    
+    # 验证效率是否超过卡诺效率，超过时限制在卡诺效率的90%以内
+    carnot_eff = (Th - Tc) / Th
+    capped = efficiencies > carnot_eff
+    efficiencies[capped] = carnot_eff * 0.9
+    
+    return efficiencies, powers, zero_flux, negative, capped
+
 class ThermoelectricCalculator:
+    # 缓存格式版本，修改parse_p_file/parse_n_file中的单位换算或热导率推导后需加1，使旧缓存失效
+    CACHE_VERSION = 1
+    
     def __init__(self):
         # 移除对iter_edit的依赖
         self.p_type_data = {}
         self.n_type_data = {}
-        self.interpolators = {}
+        self.tables = {}  # 每种材料的属性表 (4, n)：温度、塞贝克系数、电阻率、热导率
+        self.property_fns = {}  # 每种材料一次求出三种属性的插值函数
         
         # 读取P型材料数据，修正组分值对应关系
         p_files = {
@@ -131,13 +331,16 @@ class ThermoelectricCalculator:
         }
         
         def read_excel_file(filename):
-            """读取Excel文件的辅助函数"""
+            """读取Excel文件的辅助函数，返回按列组织的数组列表"""
             try:
                 # 首先尝试使用xlrd引擎
                 try:
                     import xlrd
-                    # 不使用列名读取数据
-                    data = pd.read_excel(filename, engine='xlrd', header=None)
+                    # 直接读取第一个工作表的各列数据（不使用列名），空单元格记为NaN
+                    book = xlrd.open_workbook(filename)
+                    sheet = book.sheet_by_index(0)
+                    data = [np.array([np.nan if v == '' else v for v in sheet.col_values(c)], dtype=float)
+                            for c in range(sheet.ncols)]
                     print(f"成功使用xlrd读取文件: {filename}")
                     return data
                 except ImportError:
@@ -153,14 +356,14 @@ class ThermoelectricCalculator:
                 # 检查数据的结构来确定正确的列索引
                 # 对于P_yuanshi文件（如P_yuanshi_2_5.xls），列结构为：
                 # 温度(A列,0), 塞贝克系数(B列,1), 温度(C列,2), 电阻率(D列,3), 温度(E列,4), 优值系数(F列,5)
-                if data.shape[1] >= 6:  # 确保有足够的列
+                if len(data) >= 6:  # 确保有足够的列
                     print("找到的列结构：")
-                    for i in range(min(6, data.shape[1])):
-                        print(f"列 {i}: {data.iloc[0, i]}")
+                    for i in range(min(6, len(data))):
+                        print(f"列 {i}: {data[i][0]}")
                     
                     # 检查前几行的数据来识别是P型还是N型文件
                     # P型文件特征：第一列数值在300左右（温度）
-                    first_col_values = data.iloc[0:5, 0].values
+                    first_col_values = data[0][0:5]
                     print(f"第一列前5个值: {first_col_values}")
                     
                     if any(290 <= v <= 310 for v in first_col_values if isinstance(v, (int, float))):
@@ -193,84 +396,119 @@ class ThermoelectricCalculator:
                 traceback.print_exc()
                 return None
         
+        def parse_p_file(filename):
+            """解析P型材料数据文件，返回各属性数组"""
+            data = read_excel_file(filename)
+            if data is None:
+                return None
+            try:
+                # 查找列
+                columns = find_columns(data)
+                if not columns:
+                    print(f"在文件 {filename} 中未找到所需的列")
+                    return None
+                # P型材料：F列是优值系数(ZT)，我们需要从中反推热导率
+                # 热导率 k = (α^2 × T) / (ρ × ZT)
+                # 其中 α 是塞贝克系数，ρ 是电阻率，T 是温度，ZT 是优值系数
+                seebeck = data[columns['seebeck']] * 1e-6  # μV/K 转换为 V/K
+                resistivity = data[columns['resistivity']] * 1e-6  # μΩ·m 转换为 Ω·m (修正单位换算错误)
+                temperature = data[columns['temp']]
+                zt_values = data[columns['thermal_cond']]  # 这里实际上是ZT值
+                
+                # 计算热导率，无效ZT值或除以零时使用默认值2.0
+                zt = np.asarray(zt_values, dtype=float)
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    thermal_cond = np.where(zt > 0, seebeck**2 * temperature / (resistivity * zt), 2.0)
+                thermal_cond = np.where(np.isfinite(thermal_cond), thermal_cond, 2.0)
+                
+                print(f"温度范围: {min(temperature)}-{max(temperature)} K")
+                print(f"塞贝克系数范围: {min(seebeck*1e6)}-{max(seebeck*1e6)} μV/K")
+                print(f"电阻率范围: {min(resistivity*1e6)}-{max(resistivity*1e6)} μΩ·m")
+                print(f"计算的热导率范围: {min(thermal_cond)}-{max(thermal_cond)} W/(m·K)")
+                return {
+                    "temp": temperature,
+                    "seebeck": seebeck,
+                    "resistivity": resistivity,  # 已经在之前的部分用1e-6修正过
+                    "thermal_cond": thermal_cond  # 从ZT反推的热导率
+                }
+            except Exception as e:
+                print(f"处理P型材料数据文件 {filename} 时出错: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                return None
+        
+        def parse_n_file(filename):
+            """解析N型材料数据文件，返回各属性数组"""
+            data = read_excel_file(filename)
+            if data is None:
+                return None
+            try:
+                # 查找列
+                columns = find_columns(data)
+                if not columns:
+                    print(f"在文件 {filename} 中未找到所需的列")
+                    return None
+                return {
+                    "temp": data[columns['temp']],
+                    "seebeck": -data[columns['seebeck']] * 1e-6,  # μV/K 转换为 V/K，N型为负值
+                    "resistivity": data[columns['resistivity']] * 1e-5,  # μΩ·m 转换为 Ω·m
+                    "thermal_cond": data[columns['thermal_cond']]  # W/(m·K)
+                }
+            except Exception as e:
+                print(f"处理N型材料数据文件 {filename} 时出错: {str(e)}")
+                import traceback
+                traceback.print_exc()
+                return None
+        
         # 读取所有P型材料数据
         for composition, filename in p_files.items():
             print(f"\n尝试读取P型材料数据文件: {filename}")
-            data = read_excel_file(filename)
+            data = self._load_or_cache(filename, parse_p_file)
             if data is not None:
-                try:
-                    # 查找列
-                    columns = find_columns(data)
-                    if columns:
-                        # P型材料：F列是优值系数(ZT)，我们需要从中反推热导率
-                        # 热导率 k = (α^2 × T) / (ρ × ZT)
-                        # 其中 α 是塞贝克系数，ρ 是电阻率，T 是温度，ZT 是优值系数
-                        seebeck = data[columns['seebeck']].values * 1e-6  # μV/K 转换为 V/K
-                        resistivity = data[columns['resistivity']].values * 1e-6  # μΩ·m 转换为 Ω·m (修正单位换算错误)
-                        temperature = data[columns['temp']].values
-                        zt_values = data[columns['thermal_cond']].values  # 这里实际上是ZT值
-                        
-                        # 计算热导率
-                        thermal_cond = []
-                        for i in range(len(temperature)):
-                            try:
-                                # 避免无效ZT值和除以零
-                                if zt_values[i] > 0:
-                                    # 修正电阻率单位 (正确系数1e-6)
-                                    k = (seebeck[i]**2 * temperature[i]) / (resistivity[i] * zt_values[i])
-                                    thermal_cond.append(k)
-                                else:
-                                    thermal_cond.append(2.0)  # 更合理的默认值
-                            except:
-                                thermal_cond.append(2.0)  # 更合理的默认值
-                        
-                        self.p_type_data[composition] = {
-                            "temp": temperature,
-                            "seebeck": seebeck,
-                            "resistivity": resistivity,  # 已经在之前的部分用1e-6修正过
-                            "thermal_cond": np.array(thermal_cond)  # 从ZT反推的热导率
-                        }
-                        print(f"成功读取P型材料数据: {composition}")
-                        print(f"温度范围: {min(temperature)}-{max(temperature)} K")
-                        print(f"塞贝克系数范围: {min(seebeck*1e6)}-{max(seebeck*1e6)} μV/K")
-                        print(f"电阻率范围: {min(resistivity*1e6)}-{max(resistivity*1e6)} μΩ·m")
-                        print(f"计算的热导率范围: {min(thermal_cond)}-{max(thermal_cond)} W/(m·K)")
-                    else:
-                        print(f"在文件 {filename} 中未找到所需的列")
-                        
-                except Exception as e:
-                    print(f"处理P型材料数据文件 {filename} 时出错: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
+                self.p_type_data[composition] = data
+                print(f"成功读取P型材料数据: {composition}")
         
         # 读取所有N型材料数据
         for composition, filename in n_files.items():
             print(f"\n尝试读取N型材料数据文件: {filename}")
-            data = read_excel_file(filename)
+            data = self._load_or_cache(filename, parse_n_file)
             if data is not None:
-                try:
-                    # 查找列
-                    columns = find_columns(data)
-                    if columns:
-                        self.n_type_data[composition] = {
-                            "temp": data[columns['temp']].values,
-                            "seebeck": -data[columns['seebeck']].values * 1e-6,  # μV/K 转换为 V/K，N型为负值
-                            "resistivity": data[columns['resistivity']].values * 1e-5,  # μΩ·m 转换为 Ω·m
-                            "thermal_cond": data[columns['thermal_cond']].values  # W/(m·K)
-                        }
-                        print(f"成功读取N型材料数据: {composition}")
-                    else:
-                        print(f"在文件 {filename} 中未找到所需的列")
-                        
-                except Exception as e:
-                    print(f"处理N型材料数据文件 {filename} 时出错: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
+                self.n_type_data[composition] = data
+                print(f"成功读取N型材料数据: {composition}")
                     
         print("\n数据读取完成")
         print(f"成功读取的P型材料: {list(self.p_type_data.keys())}")
         print(f"成功读取的N型材料: {list(self.n_type_data.keys())}")
         
+        # 预先为所有已读取的材料创建插值器，计算时直接查表
+        for composition in self.p_type_data:
+            self.create_interpolators('p', composition)
+        for composition in self.n_type_data:
+            self.create_interpolators('n', composition)
+        
+    def _load_or_cache(self, filename, parse):
+        """读取材料数据文件，解析结果缓存到同名.npz文件中，源文件未修改且缓存版本一致时直接读取缓存"""
+        cache = filename + '.npz'
+        try:
+            if os.path.getmtime(cache) >= os.path.getmtime(filename):
+                with np.load(cache) as cached:
+                    if '_version' in cached.files and cached['_version'] == self.CACHE_VERSION:
+                        print(f"使用缓存数据: {cache}")
+                        return {name: cached[name] for name in cached.files if name != '_version'}
+                    print(f"缓存版本不一致，重新解析: {filename}")
+        except OSError:
+            pass  # 缓存不存在或源文件缺失，重新解析
+        except Exception as e:
+            print(f"读取缓存失败: {str(e)}")
+        
+        data = parse(filename)
+        if data is not None:
+            try:
+                np.savez(cache, _version=self.CACHE_VERSION, **data)
+            except OSError as e:
+                print(f"写入缓存失败: {str(e)}")
+        return data
+        
     def create_interpolators(self, material_type, composition):
         """为给定材料创建属性插值器"""
         try:
@@ -291,26 +529,27 @@ class ThermoelectricCalculator:
             thermal_cond = thermal_cond[sort_idx]
             
             # 打印材料属性范围
-            print(f"\n===== 创建 {material_type}型材料插值器 (组分={composition}) =====")
-            print(f"温度范围: {min(temps)}-{max(temps)} K")
-            print(f"塞贝克系数范围: {min(seebeck*1e6):.2f}-{max(seebeck*1e6):.2f} μV/K")
-            print(f"电阻率范围: {min(resistivity*1e6):.2f}-{max(resistivity*1e6):.2f} μΩ·m")
-            print(f"热导率范围: {min(thermal_cond):.2f}-{max(thermal_cond):.2f} W/(m·K)")
-            
-            # 创建边界值保护的插值器
-            self.interpolators[f"{material_type}_{composition}"] = {
-                "seebeck": interp1d(temps, seebeck, kind='linear', 
-                                   bounds_error=False, 
-                                   fill_value=(seebeck[0], seebeck[-1])),  # 限制外推值
-                "resistivity": interp1d(temps, resistivity, kind='linear',
-                                      bounds_error=False,
-                                      fill_value=(resistivity[0], resistivity[-1])),
-                "thermal_cond": interp1d(temps, thermal_cond, kind='linear',
-                                       bounds_error=False,
-                                       fill_value=(thermal_cond[0], thermal_cond[-1]))
-            }
+            logger.debug("===== 创建 %s型材料插值器 (组分=%s) =====", material_type, composition)
+            logger.debug("温度范围: %s-%s K", min(temps), max(temps))
+            logger.debug("塞贝克系数范围: %.2f-%.2f μV/K", min(seebeck)*1e6, max(seebeck)*1e6)
+            logger.debug("电阻率范围: %.2f-%.2f μΩ·m", min(resistivity)*1e6, max(resistivity)*1e6)
+            logger.debug("热导率范围: %.2f-%.2f W/(m·K)", min(thermal_cond), max(thermal_cond))
+            
+            # 将排序后的数据存成一块连续的 (4, n) 属性表，各属性为其中的行，
+            # 由np.interp做线性插值（超出范围时取端点值）
+            interp_key = f"{material_type}_{composition}"
+            table = np.ascontiguousarray(np.vstack((temps, seebeck, resistivity, thermal_cond)), dtype=np.float64)
+            self.tables[interp_key] = table
+            temps, seebeck, resistivity, thermal_cond = table
             
-            print(f"插值器创建成功")
+            def properties(T):
+                """返回温度T处的塞贝克系数、电阻率和热导率"""
+                return (np.interp(T, temps, seebeck),
+                        np.interp(T, temps, resistivity),
+                        np.interp(T, temps, thermal_cond))
+            self.property_fns[interp_key] = properties
+            
+            logger.debug("插值器创建成功")
             
         except Exception as e:
             print(f"创建插值器错误: {str(e)}")
@@ -322,93 +561,23 @@ class ThermoelectricCalculator:
         根据参考算法计算温度分布
         """
         try:
-            print(f"\n开始计算温度分布: {material_type}型, 组分={composition}, 电流密度={current_density}A/cm²")
-            print(f"边界条件: Th={Th}K, Tc={Tc}K, 格点数={n_points}")
+            logger.debug("开始计算温度分布: %s型, 组分=%s, 电流密度=%sA/cm²", material_type, composition, current_density)
+            logger.debug("边界条件: Th=%sK, Tc=%sK, 格点数=%s", Th, Tc, n_points)
             
-            # 创建插值器（如果还没有创建）
+            # 插值器已在初始化时创建
             interp_key = f"{material_type}_{composition}"
-            if interp_key not in self.interpolators:
-                self.create_interpolators(material_type, composition)
             
-            # 初始化格点位置和温度
+            # 初始化格点位置
             L = 1.0  # 标准化长度
-            dx = L / (n_points - 1)  # 网格间距
             x = np.linspace(0, L, n_points)  # 从0到1的均匀分布
-            T = np.linspace(Tc, Th, n_points)  # 初始线性温度分布
-            
-            print(f"初始温度分布: {T}")
             
             # 电流密度转换为A/m²
             J = current_density * 100  # A/cm² → A/m²
             
-            # 开始迭代
-            for iter_count in range(max_iter):
-                # 计算各节点处的材料属性
-                seebeck = np.zeros(n_points)
-                resistivity = np.zeros(n_points)
-                thermal_cond = np.zeros(n_points)
-                
-                for i in range(n_points):
-                    T_safe = np.clip(T[i], 300, 700)  # 确保温度在有效范围内
-                    seebeck[i] = self.interpolators[interp_key]["seebeck"](T_safe)
-                    resistivity[i] = self.interpolators[interp_key]["resistivity"](T_safe)
-                    thermal_cond[i] = self.interpolators[interp_key]["thermal_cond"](T_safe)
-                
-                # 计算参考算法中的系数
-                c1 = J * seebeck / thermal_cond
-                c2 = -1 / thermal_cond
-                c3 = seebeck**2 * J**2 / thermal_cond
-                c4 = -J * seebeck / thermal_cond
-                c5 = resistivity * J**2
-                
-                # 构建系数矩阵和右端向量
-                A = np.zeros((n_points, n_points))
-                b = np.zeros(n_points)
-                
-                # 设置边界条件
-                A[0, 0] = 1.0
-                b[0] = Tc
-                A[n_points-1, n_points-1] = 1.0
-                b[n_points-1] = Th
-                
-                # 构造内部点的系数矩阵，使用与参考算法一致的形式
-                for i in range(1, n_points-1):
-                    A[i, i-1] = 1 / (c2[i] * dx)
-                    A[i, i] = c4[i+1] / c2[i+1] - 1 / (c2[i+1] * dx) - (1 - c1[i] * dx) / (c2[i] * dx)
-                    A[i, i+1] = (1 - c1[i+1] * dx) / (c2[i+1] * dx) - c3[i+1] * dx - (1 - c1[i+1] * dx) * c4[i+1] / c2[i+1]
-                    b[i] = c5[i-1] * dx
-                
-                # 尝试求解线性方程组
-                try:
-                    T_new = np.linalg.solve(A, b)
-                    
-                    # 检查解的合理性
-                    if np.any(np.isnan(T_new)) or np.any(np.isinf(T_new)):
-                        print(f"警告：第{iter_count+1}次迭代解不合理，使用线性插值")
-                        T_new = np.linspace(Tc, Th, n_points)
-                    
-                    # 限制温度在物理合理范围内
-                    T_new = np.clip(T_new, min(Tc, Th)*0.95, max(Tc, Th)*1.1)
-                    
-                    # 计算收敛情况
-                    max_change = np.max(np.abs(T_new - T))
-                    print(f"迭代{iter_count+1}次完成，最大温度变化: {max_change:.6f}K")
-                    
-                    # 更新温度
-                    T = T_new.copy()
-                    
-                    # 判断是否已经收敛
-                    if max_change < 0.01:  # 收敛阈值
-                        print(f"温度分布已收敛，在第{iter_count+1}次迭代")
-                        break
-                        
-                except np.linalg.LinAlgError:
-                    print(f"警告：线性方程组求解失败，使用线性温度分布")
-                    T = np.linspace(Tc, Th, n_points)
-                    break
+            T = _solve_temperature(Th, Tc, n_points, J, *self.tables[interp_key], max_iter)
             
             # 打印最终温度分布
-            print(f"最终温度分布: {T}")
+            logger.debug("最终温度分布: %s", T)
             
             return x, T
             
@@ -421,7 +590,18 @@ class ThermoelectricCalculator:
             L = 1.0
             return np.linspace(0, L, n_points), np.linspace(Tc, Th, n_points)
     
-    def calculate_efficiency(self, Th, Tc, material_type, composition, current_density, x=None, T=None):
+    def eval_props(self, material_type, composition, T):
+        """
+        求温度分布上的材料属性，结果可传给效率计算的props参数，在一组计算中重复使用
+        
+        返回:
+        (seebeck, resistivity, thermal_cond): 各格点的塞贝克系数、电阻率和热导率
+        """
+        interp_key = f"{material_type}_{composition}"
+        T_safe = np.clip(np.asarray(T, dtype=float), 300.0, 700.0)  # 确保温度在有效范围内
+        return self.property_fns[interp_key](T_safe)
+
+    def calculate_efficiency(self, Th, Tc, material_type, composition, current_density, x=None, T=None, props=None):
         """
         根据参考算法计算热电材料效率
         
@@ -432,104 +612,88 @@ class ThermoelectricCalculator:
         composition: 材料组分
         current_density: 电流密度 (A/cm²)
         x, T: 温度分布数据
+        props: 由eval_props在同一温度分布上求得的材料属性，省略时重新计算
         
         返回:
-        efficiency: 效率 (%)
+        efficiency: 效率 (小数)
         power: 输出功率密度 (W/m²)
         """
+        efficiencies, powers = self.calculate_efficiency_batch(
+            Th, Tc, material_type, composition, np.array([current_density], dtype=float), x, T, props)
+        return float(efficiencies[0]), float(powers[0])
+
+    def calculate_efficiency_batch(self, Th, Tc, material_type, composition, current_densities, x=None, T=None,
+                                   props=None):
+        """
+        对一组电流密度同时计算热电材料效率，材料属性只在温度分布上求一次
+        
+        参数:
+        Th: 高温端温度 (K)
+        Tc: 低温端温度 (K)
+        material_type: 材料类型 ('p' 或 'n')
+        composition: 材料组分
+        current_densities: 电流密度数组 (A/cm²)
+        x, T: 温度分布数据
+        props: 由eval_props在同一温度分布上求得的材料属性，省略时重新计算
+        
+        返回:
+        efficiencies: 效率数组 (小数)
+        powers: 输出功率密度数组 (W/m²)
+        """
+        current_densities = np.asarray(current_densities, dtype=float)
         try:
             # 验证输入参数
             if Th <= Tc:
-                print(f"警告: 温度差无效 (Th={Th}K, Tc={Tc}K)")
-                return 0.0, 0.0
-                
-            # 准备插值器
-            interp_key = f"{material_type}_{composition}"
-            if interp_key not in self.interpolators:
-                self.create_interpolators(material_type, composition)
+                logger.warning("警告: 温度差无效 (Th=%sK, Tc=%sK)", Th, Tc)
+                return np.zeros_like(current_densities), np.zeros_like(current_densities)
                 
             # 确保温度分布数据有效
             if x is None or T is None or len(x) < 3:
-                print(f"温度分布数据无效，使用线性温度分布近似")
+                logger.warning("温度分布数据无效，使用线性温度分布近似")
                 n_points = 20
                 x = np.linspace(0, 1.0, n_points)
                 T = np.linspace(Tc, Th, n_points)
+                props = None  # 温度分布已替换，需重新求材料属性
                 
             # 获取格点数和间距
+            T = np.asarray(T, dtype=float)
             n_points = len(x)
             dx = (x[-1] - x[0]) / (n_points - 1)
             
             # 获取材料属性
-            seebeck = np.zeros(n_points)
-            resistivity = np.zeros(n_points)
-            thermal_cond = np.zeros(n_points)
-            
-            for i in range(n_points):
-                T_safe = np.clip(T[i], 300, 700)  # 确保温度在有效范围内
-                seebeck[i] = self.interpolators[interp_key]["seebeck"](T_safe)
-                resistivity[i] = self.interpolators[interp_key]["resistivity"](T_safe)
-                thermal_cond[i] = self.interpolators[interp_key]["thermal_cond"](T_safe)
+            if props is None:
+                props = self.eval_props(material_type, composition, T)
+            seebeck, resistivity, thermal_cond = props
                 
             # 电流密度转换为SI单位: A/cm² → A/m²
-            J = current_density * 10000  # 转换为A/m²
-            
-            # 计算参考算法中的系数
-            c1 = J * seebeck / thermal_cond
-            c2 = -1 / thermal_cond
-            c3 = seebeck**2 * J**2 / thermal_cond
-            c4 = -J * seebeck / thermal_cond
-            c5 = resistivity * J**2
-            
-            # 计算热流密度 q
-            q = np.zeros(n_points)
-            for k in range(1, n_points):
-                q[k] = ((1/dx - c1[k]) * T[k] - T[k-1]/dx) / c2[k]
-            # 边界热流计算
-            q[0] = (1 - c4[1] * dx) * q[1] - c3[1] * dx * T[1] - c5[1] * dx
-            
-            # 计算积分项
-            cumulative_seebeck = 0  # 塞贝克积分项
-            cumulative_resistivity = 0  # 电阻率积分项
-            
-            for m in range(1, n_points):
-                T1 = T[m]
-                T2 = T[m-1]
-                # 使用梯形法则进行积分
-                avg_seebeck = (seebeck[m] + seebeck[m-1]) / 2
-                avg_resistivity = (resistivity[m] + resistivity[m-1]) / 2
-                
-                cumulative_seebeck += avg_seebeck * (T1 - T2)
-                cumulative_resistivity += avg_resistivity * dx
-            
-            # 计算效率
-            if q[n_points-1] != 0:
-                efficiency = J * (cumulative_seebeck + J * cumulative_resistivity) / q[n_points-1] * 100  # 转为百分比
-                
-                # 检查是否为有效值
-                if efficiency < 0:
-                    print(f"计算得到负效率 ({efficiency:.4f}%), 设为0")
-                    efficiency = 0.0
-                    
-                # 验证效率是否超过卡诺效率
-                carnot_eff = (Th - Tc) / Th * 100
-                if efficiency > carnot_eff:
-                    print(f"警告: 计算效率 {efficiency:.4f}% 超过卡诺效率 {carnot_eff:.4f}%")
-                    efficiency = carnot_eff * 0.9  # 限制在卡诺效率的90%以内
-            else:
-                print("热流为零，无法计算效率")
-                efficiency = 0.0
-                
-            # 计算功率
-            power = J * (cumulative_seebeck + J * cumulative_resistivity)
-            
-            print(f"材料: {material_type}型, 组分={composition}, 电流密度={current_density}A/cm², 效率={efficiency:.4f}%")
-            return efficiency, power
+            J = current_densities * 10000  # 转换为A/m²
+            
+            efficiencies, powers, zero_flux, negative, capped = _efficiency_kernel(
+                Th, Tc, T, dx, J, seebeck, resistivity, thermal_cond)
+            
+            # 每批只汇总输出一次异常情况
+            n_capped = np.count_nonzero(capped)
+            if n_capped:
+                logger.warning("警告：%s型材料 (组分=%s) 有%d个电流密度的计算效率超过卡诺效率 %.4f%%，已按卡诺效率的90%%计",
+                               material_type, composition, n_capped, (Th - Tc) / Th * 100)
+            if logger.isEnabledFor(logging.DEBUG):
+                n_zero_flux = np.count_nonzero(zero_flux)
+                if n_zero_flux:
+                    logger.debug("%d个电流密度下热流为零，无法计算效率，记为0", n_zero_flux)
+                n_negative = np.count_nonzero(negative)
+                if n_negative:
+                    logger.debug("%d个电流密度下计算得到负效率，设为0", n_negative)
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                for j, eff in zip(current_densities, efficiencies):
+                    logger.debug("材料: %s型, 组分=%s, 电流密度=%sA/cm², 效率=%.4f%%", material_type, composition, j, eff * 100)
+            return efficiencies, powers
             
         except Exception as e:
             print(f"效率计算错误: {str(e)}")
             import traceback
             traceback.print_exc()
-            return 0.0, 0.0
+            return np.zeros_like(current_densities), np.zeros_like(current_densities)
 
     def calculate_zt(self, material_type, composition, temperature):
         """计算给定温度下的优值系数 ZT = S²T/(kρ)
@@ -537,45 +701,43 @@ class ThermoelectricCalculator:
         参数:
         material_type: 'p' 或 'n'，材料类型
         composition: 材料成分
-        temperature: 温度 (K)
+        temperature: 温度 (K)，可以是标量或数组
         
         返回:
-        zt: 优值系数
+        zt: 优值系数，与输入温度同形状的数组（标量输入时为0维数组）
         """
         try:
-            # 创建插值器（如果还没有创建）
+            # 插值器已在初始化时创建
             interp_key = f"{material_type}_{composition}"
-            if interp_key not in self.interpolators:
-                self.create_interpolators(material_type, composition)
+            T = np.asarray(temperature, dtype=np.float64)
             
-            # 获取材料属性
-            # 塞贝克系数 (V/K)，使用绝对值因为N型材料的塞贝克系数为负
-            seebeck = abs(self.interpolators[interp_key]["seebeck"](temperature))
-            # 电阻率 (Ω·m)
-            resistivity = self.interpolators[interp_key]["resistivity"](temperature)
-            # 热导率 (W/(m·K))
-            thermal_cond = self.interpolators[interp_key]["thermal_cond"](temperature)
+            # 获取材料属性：塞贝克系数 (V/K)、电阻率 (Ω·m)、热导率 (W/(m·K))
+            seebeck, resistivity, thermal_cond = self.property_fns[interp_key](T)
+            # 使用塞贝克系数的绝对值，因为N型材料的塞贝克系数为负
+            seebeck = np.abs(seebeck)
             
             # 计算优值系数 ZT = S²T/(kρ)
             # S: 塞贝克系数 (V/K)
             # T: 温度 (K)
             # k: 热导率 (W/(m·K))
             # ρ: 电阻率 (Ω·m)
-            zt = (seebeck ** 2) * temperature / (thermal_cond * resistivity)
+            zt = (seebeck ** 2) * T / (thermal_cond * resistivity)
             
             return zt
             
         except Exception as e:
             print(f"计算优值系数错误: {str(e)}")
-            return 0
+            return np.zeros(np.shape(temperature))
 
     def visualize_energy_flow(self, material_type, composition, current_density, x, T):
         """
         可视化材料内部的能量流动
         """
         try:
-            # 创建图表
-            fig, axes = plt.subplots(2, 1, figsize=(8, 10))
+            plt = _pyplot()
+            
+            # 创建图表，重复分析时复用同一窗口
+            fig, axes = plt.subplots(2, 1, figsize=(8, 10), num='energy_flow', clear=True)
             fig.suptitle(f"{material_type}型材料 (组分={composition}) 能量流分析", fontsize=14)
             
             # 转换单位
@@ -585,23 +747,13 @@ class ThermoelectricCalculator:
             n_points = len(x)
             dx = (x[-1] - x[0]) / (n_points - 1)
             
-            # 计算温度梯度
-            dTdx = np.zeros_like(T)
-            dTdx[1:-1] = (T[2:] - T[:-2]) / (2*dx)
-            dTdx[0] = (T[1] - T[0]) / dx
-            dTdx[-1] = (T[-1] - T[-2]) / dx
+            # 计算温度梯度（内部点中心差分，端点单侧差分）
+            dTdx = np.gradient(T, dx)
             
             # 获取材料属性
             interp_key = f"{material_type}_{composition}"
-            seebeck = np.zeros(n_points)
-            resistivity = np.zeros(n_points)
-            thermal_cond = np.zeros(n_points)
-            
-            for i in range(n_points):
-                T_safe = np.clip(T[i], 300, 700)
-                seebeck[i] = self.interpolators[interp_key]["seebeck"](T_safe)
-                resistivity[i] = self.interpolators[interp_key]["resistivity"](T_safe)
-                thermal_cond[i] = self.interpolators[interp_key]["thermal_cond"](T_safe)
+            T_safe = np.clip(T, 300.0, 700.0)
+            seebeck, resistivity, thermal_cond = self.property_fns[interp_key](T_safe)
             
             # 计算各种热流密度
             fourier_heat = thermal_cond * dTdx              # 傅里叶热流 κ·dT/dx
@@ -640,6 +792,12 @@ class ThermoelectricCalculator:
             traceback.print_exc()
 
 class ThermoelectricApp(QMainWindow):
+    # 固定的计算范围，各次更新共用
+    ZT_TEMPS = np.arange(300, 701, 20, dtype=np.float64)  # 优值系数温度范围 300:20:700，与MATLAB代码一致
+    P_CURRENTS = np.linspace(-30, 0, 16)  # P型效率曲线的电流密度范围，与参考算法一致
+    N_CURRENTS = np.linspace(0, 50, 51)   # N型效率曲线的电流密度范围（0-50，步长1）
+    DEV_CURRENTS = np.linspace(0.1, 4, 40)  # 器件性能的电流密度范围，避免从0开始（可能导致除零错误）
+    
     def __init__(self):
         super().__init__()
         self.setup_plot_style()
@@ -667,6 +825,10 @@ class ThermoelectricApp(QMainWindow):
         
         # 初始化计算器 - 现在iter_edit已经存在
         self.calculator = ThermoelectricCalculator()
+        # 效率曲线分析结果缓存，键为 (Th, Tc, 材料类型, 组分, 温度分布)
+        self._eff_curve_cache = {}
+        # 分析图窗口，按分析类型复用
+        self._analysis_dialogs = {}
         
         # 创建中间面板
         middle_panel = self.create_middle_panel()
@@ -692,6 +854,7 @@ class ThermoelectricApp(QMainWindow):
         self.right_export_button.clicked.connect(self.export_data)
 
     def setup_plot_style(self):
+        plt = _pyplot()
         plt.style.use('default')
         
         # 设置中文字体
@@ -709,6 +872,30 @@ class ThermoelectricApp(QMainWindow):
             'figure.subplot.wspace': 0.3
         })
 
+    def bind_numeric_edit(self, edit, attr, convert=float):
+        """将输入框的数值缓存到属性attr中，文本变化时更新，无法解析时记为None"""
+        def update_value(text):
+            try:
+                setattr(self, attr, convert(text))
+            except ValueError:
+                setattr(self, attr, None)
+        
+        update_value(edit.text())
+        edit.textChanged.connect(update_value)
+
+    def input_values(self, *attrs):
+        """读取缓存的输入框数值，有无效输入时抛出ValueError"""
+        values = tuple(getattr(self, attr) for attr in attrs)
+        if None in values:
+            raise ValueError("输入参数无效，请检查输入框中的数值")
+        return values
+
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def load_scaled_pixmap(path, width, height):
+        """读取图片并平滑缩放到指定大小，结果按参数缓存，重建面板时无需再次读取和缩放"""
+        return QPixmap(path).scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
     def create_toolbar_buttons(self):
         buttons = []
         icons = ["⌂", "←", "→", "✥", "🔍", "≡", "📄"]
@@ -729,6 +916,9 @@ class ThermoelectricApp(QMainWindow):
         return buttons
 
     def create_plot_widget(self, num_subplots=2, height=3, vertical=False):
+        plt = _pyplot()
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        
         container = QWidget()
         layout = QVBoxLayout(container)
         layout.setContentsMargins(0, 0, 0, 0)  # 完全移除边距
@@ -784,16 +974,11 @@ class ThermoelectricApp(QMainWindow):
         if num_subplots == 1:
             axes = [axes]
         
-        # 设置图表样式
+        # 设置图表样式（背景色已由rcParams设置），tick_params同时作用于已有和之后创建的刻度标签
         for ax in axes:
             ax.grid(True, color='white', linestyle='-', alpha=0.8)
-            ax.set_facecolor('#F0F0F0')
-            ax.clear()
-            ax.grid(True)
             # 调整字体大小
             ax.tick_params(labelsize=8)
-            for label in ax.get_xticklabels() + ax.get_yticklabels():
-                label.set_fontsize(8)
         
         # 调整图表间距，进一步减小上边距
         plt.subplots_adjust(top=0.88, bottom=0.15, left=0.15, right=0.95)
@@ -829,9 +1014,7 @@ class ThermoelectricApp(QMainWindow):
         
         # 使用新的ClickableImageLabel替代QLabel
         image_label = ClickableImageLabel()
-        pixmap = QPixmap("图片1.png")
-        scaled_pixmap = pixmap.scaled(400, 320, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        image_label.setPixmap(scaled_pixmap)
+        image_label.setPixmap(self.load_scaled_pixmap("图片1.png", 400, 320))
         image_label.setAlignment(Qt.AlignCenter)
         # 添加提示文本
         image_label.setToolTip("双击查看大图")
@@ -849,18 +1032,22 @@ class ThermoelectricApp(QMainWindow):
         # 温度和网格设置
         params_layout.addWidget(QLabel("高温温度Th(K)"), 0, 0)
         self.th_edit = QLineEdit("500")
+        self.bind_numeric_edit(self.th_edit, '_Th')
         params_layout.addWidget(self.th_edit, 0, 1)
         
         params_layout.addWidget(QLabel("格子数量"), 0, 2)
         self.grid_edit = QLineEdit("10")
+        self.bind_numeric_edit(self.grid_edit, '_n_points', int)
         params_layout.addWidget(self.grid_edit, 0, 3)
         
         params_layout.addWidget(QLabel("低温温度Tc(K)"), 1, 0)
         self.tc_edit = QLineEdit("300")
+        self.bind_numeric_edit(self.tc_edit, '_Tc')
         params_layout.addWidget(self.tc_edit, 1, 1)
         
         params_layout.addWidget(QLabel("迭代次数"), 1, 2)
         self.iter_edit = QLineEdit("20")
+        self.bind_numeric_edit(self.iter_edit, '_max_iter', int)
         params_layout.addWidget(self.iter_edit, 1, 3)
         
         # 材料选择
@@ -885,6 +1072,8 @@ class ThermoelectricApp(QMainWindow):
         zt_container, (ax1, ax2), canvas = self.create_plot_widget(height=2)
         self.zt_axes = (ax1, ax2)  # 保存axes引用以便后续更新
         self.zt_canvas = canvas    # 保存canvas引用以便后续更新
+        self._zt_lines = None      # 首次更新时创建的ZT曲线，之后只更新数据
+        self._zt_cache_key = None  # 当前ZT曲线对应的 (P型组分, N型组分)
         
         # 设置P型图表
         ax1.set_title("P型半导体材料", pad=5)
@@ -905,7 +1094,7 @@ class ThermoelectricApp(QMainWindow):
         ax2.set_facecolor('#F0F0F0')
         
         # 调整图表布局
-        plt.tight_layout()
+        _pyplot().tight_layout()
         
         zt_layout.addWidget(zt_container)
         zt_group.setLayout(zt_layout)
@@ -946,6 +1135,8 @@ class ThermoelectricApp(QMainWindow):
         # 保存温度分布图表的引用
         self.temp_axes = (ax1, ax2)
         self.temp_canvas = canvas
+        self._temp_lines = None  # 首次更新时创建的温度曲线，之后只更新数据
+        self._temp_background = None  # 不含标注的图表背景，用于点击标注时的局部重绘
         
         # 移除多余的提示标签
         
@@ -984,6 +1175,8 @@ class ThermoelectricApp(QMainWindow):
         # 保存效率图表的引用
         self.eff_axes = (ax3, ax4)
         self.eff_canvas = canvas
+        self._eff_cache_key = None  # 当前效率图对应的输入参数和温度分布
+        self._eff_artists = None    # 首次更新时创建的效率曲线和标记，之后只更新数据
         
         ax3.set_title("效率（P型）")
         ax4.set_title("效率（N型）")
@@ -1029,6 +1222,7 @@ class ThermoelectricApp(QMainWindow):
         ratio_layout.setContentsMargins(0, 0, 0, 0)
         ratio_layout.addWidget(QLabel("N型分支面积/P型分支面积"))
         self.ratio_edit = QLineEdit("0.1")
+        self.bind_numeric_edit(self.ratio_edit, '_ratio')
         ratio_layout.addWidget(self.ratio_edit)
         layout.addLayout(ratio_layout)
         
@@ -1039,6 +1233,8 @@ class ThermoelectricApp(QMainWindow):
         power_ax.set_ylabel("功率（W/cm2）")
         power_ax.set_xlim(0, 1)
         power_ax.set_ylim(0, 1)
+        self.power_ax = power_ax          # 保存axes和canvas引用以便计算后直接更新
+        self.power_canvas = power_canvas
         layout.addWidget(power_container)
         
         # 2. 器件效率图表
@@ -1048,6 +1244,8 @@ class ThermoelectricApp(QMainWindow):
         efficiency_ax.set_ylabel("效率")
         efficiency_ax.set_xlim(0, 1)
         efficiency_ax.set_ylim(0, 1)
+        self.device_eff_ax = efficiency_ax
+        self.device_eff_canvas = efficiency_canvas
         layout.addWidget(efficiency_container)
         
         # 最大功率点和最大效率点显示框
@@ -1106,6 +1304,11 @@ class ThermoelectricApp(QMainWindow):
         optimization_ax.set_ylabel("效率")
         optimization_ax.set_xlim(0, 1)
         optimization_ax.set_ylim(0, 1)
+        self.opt_ax = optimization_ax
+        self.opt_canvas = optimization_canvas
+        self._device_artists = None  # 首次计算时创建的器件性能曲线和标记，之后只更新数据
+        self._opt_artists = None     # 首次得到有效结果时创建的优化区间曲线和标记
+        self._device_results = None  # 最近一次器件性能计算的数值结果，供导出使用
         layout.addWidget(optimization_container)
         
         # 底部按钮
@@ -1129,57 +1332,25 @@ class ThermoelectricApp(QMainWindow):
             p_composition = self.p_type_combo.currentText()
             n_composition = self.n_type_combo.currentText()
             
-            # 创建温度范围（300K - 700K），与MATLAB代码一致
-            temperatures = np.arange(300, 701, 20)  # 300:20:700
-            
-            # 计算P型材料的优值系数
-            p_zt = []
-            for T in temperatures:
-                # 直接从Excel文件中读取ZT值，与MATLAB代码一致
-                interp_key = f"p_{p_composition}"
-                if interp_key not in self.calculator.interpolators:
-                    self.calculator.create_interpolators('p', p_composition)
-                p_zt.append(self.calculator.calculate_zt('p', p_composition, T))
-            
-            # 计算N型材料的优值系数
-            n_zt = []
-            for T in temperatures:
-                interp_key = f"n_{n_composition}"
-                if interp_key not in self.calculator.interpolators:
-                    self.calculator.create_interpolators('n', n_composition)
-                n_zt.append(self.calculator.calculate_zt('n', n_composition, T))
-            
-            # 更新P型图表
-            self.zt_axes[0].clear()
-            self.zt_axes[0].plot(temperatures, p_zt, 'b+-', linewidth=2)  # 使用蓝色+号标记，与MATLAB一致
-            self.zt_axes[0].set_title("P型半导体材料优值系数", pad=5)
-            self.zt_axes[0].set_xlabel("温度 (K)")
-            self.zt_axes[0].set_ylabel("ZT")
-            self.zt_axes[0].set_xlim(300, 700)
-            self.zt_axes[0].set_ylim(0, 2.0)  # 与MATLAB图形一致
-            self.zt_axes[0].grid(True, linestyle='--', alpha=0.7)
-            
-            # 更新N型图表
-            self.zt_axes[1].clear()
-            self.zt_axes[1].plot(temperatures, n_zt, 'r*-', linewidth=2)  # 使用红色*号标记，与MATLAB一致
-            self.zt_axes[1].set_title("N型半导体材料优值系数", pad=5)
-            self.zt_axes[1].set_xlabel("温度 (K)")
-            self.zt_axes[1].set_ylabel("ZT")
-            self.zt_axes[1].set_xlim(300, 700)
-            self.zt_axes[1].set_ylim(0, 2.0)  # 与MATLAB图形一致
-            self.zt_axes[1].grid(True, linestyle='--', alpha=0.7)
-            
-            # 设置两个图表的共同属性
-            for ax in self.zt_axes:
-                ax.set_facecolor('#F8F8F8')
-                ax.tick_params(direction='in')  # 刻度线向内
-                ax.spines['top'].set_visible(True)
-                ax.spines['right'].set_visible(True)
-                # 设置主要刻度
-                ax.set_xticks(np.arange(300, 701, 100))
-                ax.set_yticks(np.arange(0, 2.1, 0.5))
-                # 添加次要刻度
-                ax.minorticks_on()
+            # 材料组分未变时ZT曲线不变，无需重新计算和重绘
+            cache_key = (p_composition, n_composition)
+            if self._zt_lines is not None and cache_key == self._zt_cache_key:
+                return
+            
+            # 温度范围（300K - 700K），与MATLAB代码一致
+            temperatures = self.ZT_TEMPS
+            
+            # 一次计算整个温度范围内P型和N型材料的优值系数
+            p_zt = self.calculator.calculate_zt('p', p_composition, temperatures)
+            n_zt = self.calculator.calculate_zt('n', n_composition, temperatures)
+            
+            # 首次更新时设置坐标轴并创建曲线，之后只替换曲线数据
+            if self._zt_lines is None:
+                self.setup_zt_axes()
+            
+            self._zt_lines[0].set_data(temperatures, p_zt)
+            self._zt_lines[1].set_data(temperatures, n_zt)
+            self._zt_cache_key = cache_key
             
             # 刷新图表
             self.zt_canvas.draw()
@@ -1189,10 +1360,41 @@ class ThermoelectricApp(QMainWindow):
             import traceback
             traceback.print_exc()
 
+    def setup_zt_axes(self):
+        """设置优值系数图表的坐标轴样式并创建P型和N型ZT曲线"""
+        # P型图表，使用蓝色+号标记，与MATLAB一致
+        self.zt_axes[0].clear()
+        p_line, = self.zt_axes[0].plot([], [], 'b+-', linewidth=2)
+        self.zt_axes[0].set_title("P型半导体材料优值系数", pad=5)
+        
+        # N型图表，使用红色*号标记，与MATLAB一致
+        self.zt_axes[1].clear()
+        n_line, = self.zt_axes[1].plot([], [], 'r*-', linewidth=2)
+        self.zt_axes[1].set_title("N型半导体材料优值系数", pad=5)
+        
+        # 设置两个图表的共同属性
+        for ax in self.zt_axes:
+            ax.set_xlabel("温度 (K)")
+            ax.set_ylabel("ZT")
+            ax.set_xlim(300, 700)
+            ax.set_ylim(0, 2.0)  # 与MATLAB图形一致
+            ax.grid(True, linestyle='--', alpha=0.7)
+            ax.set_facecolor('#F8F8F8')
+            ax.tick_params(direction='in')  # 刻度线向内
+            ax.spines['top'].set_visible(True)
+            ax.spines['right'].set_visible(True)
+            # 设置主要刻度
+            ax.set_xticks(np.arange(300, 701, 100))
+            ax.set_yticks(np.arange(0, 2.1, 0.5))
+            # 添加次要刻度
+            ax.minorticks_on()
+        
+        self._zt_lines = (p_line, n_line)
+
     def initialize_calculation(self):
         """初始化运算"""
         try:
-            print("\n===== 开始初始化计算 =====")
+            logger.debug("===== 开始初始化计算 =====")
             # 更新状态指示灯为红色（计算中）
             self.status_light.set_status(False)
             QApplication.processEvents()  # 确保UI更新
@@ -1201,12 +1403,9 @@ class ThermoelectricApp(QMainWindow):
             self.update_zt_plots()
             
             # 获取输入参数
-            Th = float(self.th_edit.text())
-            Tc = float(self.tc_edit.text())
-            n_points = int(self.grid_edit.text())
-            max_iter = int(self.iter_edit.text())  # 获取迭代次数
+            Th, Tc, n_points, max_iter = self.input_values('_Th', '_Tc', '_n_points', '_max_iter')
             
-            print(f"输入参数: Th={Th}K, Tc={Tc}K, 格点数={n_points}")
+            logger.debug("输入参数: Th=%sK, Tc=%sK, 格点数=%s", Th, Tc, n_points)
             
             # 计算P型和N型材料的温度分布
             p_composition = self.p_type_combo.currentText()
@@ -1216,8 +1415,8 @@ class ThermoelectricApp(QMainWindow):
             p_current = float(self.p_current_combo.currentText())
             n_current = float(self.n_current_combo.currentText())
             
-            print(f"P型材料: 组分={p_composition}, 电流密度={p_current}A/cm²")
-            print(f"N型材料: 组分={n_composition}, 电流密度={n_current}A/cm²")
+            logger.debug("P型材料: 组分=%s, 电流密度=%sA/cm²", p_composition, p_current)
+            logger.debug("N型材料: 组分=%s, 电流密度=%sA/cm²", n_composition, n_current)
             
             # 将最大迭代次数传递给温度分布计算函数
             x_p, T_p = self.calculator.calculate_temperature_distribution(
@@ -1225,22 +1424,19 @@ class ThermoelectricApp(QMainWindow):
             x_n, T_n = self.calculator.calculate_temperature_distribution(
                 Th, Tc, n_points, 'n', n_composition, n_current, max_iter)
             
-            # 保存计算结果以便后续使用
-            self.x_p, self.T_p = x_p, T_p
-            self.x_n, self.T_n = x_n, T_n
-            
-            print("计算完成，正在更新温度分布图...")
+            # 将计算结果存入一块连续数组 (材料, 坐标/温度, 格点) 以便后续使用，
+            # 各属性为其中的连续视图
+            self._grid = np.array(((x_p, T_p), (x_n, T_n)), dtype=np.float64)
+            (self.x_p, self.T_p), (self.x_n, self.T_n) = self._grid
             
-            # 删除旧的点击事件处理器（如果存在）
-            if hasattr(self, '_pick_cid') and self._pick_cid:
-                self.temp_canvas.mpl_disconnect(self._pick_cid)
+            logger.debug("计算完成，正在更新温度分布图...")
             
             # 更新温度分布图
             self.update_temperature_plots(x_p, T_p, x_n, T_n)
             
             # 计算完成，更新状态指示灯为绿色
             self.status_light.set_status(True)
-            print("===== 初始化计算完成 =====")
+            logger.debug("===== 初始化计算完成 =====")
             
         except Exception as e:
             print(f"初始化计算错误: {str(e)}")
@@ -1256,9 +1452,30 @@ class ThermoelectricApp(QMainWindow):
             # 使用保存的引用直接访问图表
             ax1, ax2 = self.temp_axes
             
-            # 清除旧数据
-            ax1.clear()
-            ax2.clear()
+            # 首次更新时创建曲线并连接点击事件，之后只移除旧标注
+            if self._temp_lines is None:
+                ax1.clear()
+                ax2.clear()
+                # 使用标记和细线，设置picker参数启用点击事件
+                p_line, = ax1.plot([], [], 'b*-', markersize=6, picker=5)
+                n_line, = ax2.plot([], [], 'r*-', markersize=6, picker=5)
+                self._temp_lines = (p_line, n_line)
+                
+                # 设置标题和标签
+                ax1.set_title("格点温度分布（P型）")
+                ax2.set_title("格点温度分布（N型）")
+                for ax in (ax1, ax2):
+                    ax.set_xlabel("格点位置")
+                    ax.set_ylabel("温度 (K)")
+                    ax.grid(True, linestyle='--', alpha=0.7)
+                
+                # 连接点击事件，并在每次完整重绘后保存背景
+                self.temp_canvas.mpl_connect('pick_event', self.on_temperature_pick)
+                self.temp_canvas.mpl_connect('draw_event', self.on_temperature_draw)
+            else:
+                for ax in (ax1, ax2):
+                    for artist in list(ax.texts):
+                        artist.remove()
             
             # 获取格点数量
             n_points_p = len(x_p)
@@ -1268,63 +1485,16 @@ class ThermoelectricApp(QMainWindow):
             grid_points_p = np.arange(1, n_points_p + 1)
             grid_points_n = np.arange(1, n_points_n + 1)
             
-            print(f"\n=== 温度分布图数据 ===")
-            print(f"P型格点数量: {n_points_p}")
-            print(f"P型温度数据: {T_p}")
-            print(f"N型格点数量: {n_points_n}")
-            print(f"N型温度数据: {T_n}")
-            
-            # 绘制新数据 - 使用标记和细线
-            p_line, = ax1.plot(grid_points_p, T_p, 'b*-', markersize=6, picker=5)  # 设置picker参数启用点击事件
-            n_line, = ax2.plot(grid_points_n, T_n, 'r*-', markersize=6, picker=5)
-            
-            # 添加点击事件处理函数
-            def on_pick(event):
-                if event.artist == p_line:
-                    ind = event.ind[0]
-                    ax = ax1
-                    grid_points = grid_points_p
-                    temps = T_p
-                    title = "P型材料"
-                elif event.artist == n_line:
-                    ind = event.ind[0]
-                    ax = ax2
-                    grid_points = grid_points_n
-                    temps = T_n
-                    title = "N型材料"
-                else:
-                    return
-                
-                # 显示详细信息
-                pos = grid_points[ind]
-                temp = temps[ind]
-                
-                # 移除之前的标注（如果有）
-                for artist in ax.texts:
-                    artist.remove()
-                
-                # 添加新标注
-                ax.annotate(f'格点: {pos}\n温度: {temp:.2f}K',
-                            xy=(pos, temp), xytext=(pos+0.5, temp+10),
-                            arrowprops=dict(arrowstyle='->',
-                                            connectionstyle='arc3,rad=.2',
-                                            color='green'),
-                            bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.7),
-                            fontsize=8)
-                
-                # 更新图表
-                self.temp_canvas.draw()
-                
-                # 输出详细数据到控制台
-                print(f"{title} 格点位置 {pos} 的详细数据:")
-                print(f"  温度: {temp:.2f}K")
-            
-            # 连接点击事件
-            self._pick_cid = self.temp_canvas.mpl_connect('pick_event', on_pick)
+            logger.debug("=== 温度分布图数据 ===")
+            logger.debug("P型格点数量: %s", n_points_p)
+            logger.debug("P型温度数据: %s", T_p)
+            logger.debug("N型格点数量: %s", n_points_n)
+            logger.debug("N型温度数据: %s", T_n)
             
-            # 设置标题和标签
-            ax1.set_title("格点温度分布（P型）")
-            ax2.set_title("格点温度分布（N型）")
+            # 更新曲线数据，并保存供点击事件使用
+            self._temp_lines[0].set_data(grid_points_p, T_p)
+            self._temp_lines[1].set_data(grid_points_n, T_n)
+            self._temp_data = ((grid_points_p, T_p), (grid_points_n, T_n))
             
             # 获取温度的最小值和最大值，用于设置Y轴范围
             min_temp = min(min(T_p), min(T_n))
@@ -1332,9 +1502,6 @@ class ThermoelectricApp(QMainWindow):
             
             # 设置坐标轴范围和刻度
             for ax, n_points in zip([ax1, ax2], [n_points_p, n_points_n]):
-                ax.set_xlabel("格点位置")
-                ax.set_ylabel("温度 (K)")
-                
                 # 动态设置横坐标范围和刻度
                 ax.set_xlim(0.5, n_points + 0.5)  # 添加边距
                 
@@ -1348,30 +1515,181 @@ class ThermoelectricApp(QMainWindow):
                 # 设置Y轴范围
                 y_margin = (max_temp - min_temp) * 0.1  # 添加10%的边距
                 ax.set_ylim(min_temp - y_margin, max_temp + y_margin)
-                
-                # 添加网格
-                ax.grid(True, linestyle='--', alpha=0.7)
             
             # 刷新图表
             self.temp_canvas.draw()
-            print("温度分布图更新完成")
+            logger.debug("温度分布图更新完成")
             
         except Exception as e:
             print(f"更新温度分布图错误: {str(e)}")
             import traceback
             traceback.print_exc()
     
+    def on_temperature_pick(self, event):
+        """点击温度分布图上的数据点时显示该格点的温度"""
+        p_line, n_line = self._temp_lines
+        ax1, ax2 = self.temp_axes
+        if event.artist == p_line:
+            ax = ax1
+            grid_points, temps = self._temp_data[0]
+            title = "P型材料"
+        elif event.artist == n_line:
+            ax = ax2
+            grid_points, temps = self._temp_data[1]
+            title = "N型材料"
+        else:
+            return
+        
+        # 显示详细信息
+        ind = event.ind[0]
+        pos = grid_points[ind]
+        temp = temps[ind]
+        
+        # 移除之前的标注（如果有）
+        for artist in list(ax.texts):
+            artist.remove()
+        
+        # 添加新标注，标注不参与完整重绘，由blit单独绘制
+        ax.annotate(f'格点: {pos}\n温度: {temp:.2f}K',
+                    xy=(pos, temp), xytext=(pos+0.5, temp+10),
+                    arrowprops=dict(arrowstyle='->',
+                                    connectionstyle='arc3,rad=.2',
+                                    color='green'),
+                    bbox=dict(boxstyle='round,pad=0.5', fc='yellow', alpha=0.7),
+                    fontsize=8, animated=True)
+        
+        # 更新图表：恢复背景后只重绘标注
+        if self._temp_background is None:
+            self.temp_canvas.draw()
+        else:
+            self.temp_canvas.restore_region(self._temp_background)
+            for other_ax in self.temp_axes:
+                for artist in other_ax.texts:
+                    other_ax.draw_artist(artist)
+            self.temp_canvas.blit(self.temp_canvas.figure.bbox)
+        
+        # 输出详细数据到控制台
+        logger.debug("%s 格点位置 %s 的详细数据:", title, pos)
+        logger.debug("  温度: %.2fK", temp)
+
+    def setup_efficiency_axes(self):
+        """设置效率图表的坐标轴样式并创建效率曲线、数据点和标记"""
+        self._eff_artists = []
+        # P型横坐标重点关注-5到0部分，N型横坐标范围为0-50
+        for ax, title, color, marker_color, xlim in zip(
+                self.eff_axes, ("P型材料效率", "N型材料效率"), ('b', 'r'), ('red', 'blue'), ((-5, 0), (0, 50))):
+            ax.clear()
+            line, = ax.plot([], [], color=color, linestyle='-', linewidth=1.5)
+            # rasterized只影响矢量格式导出(PDF/SVG)：散点以位图嵌入，减小文件体积；屏幕上的Agg重绘不受影响
+            points = ax.scatter([], [], color=line.get_color(), s=20, marker='o', rasterized=True)
+            # 当前选择的电流密度和最大效率点的标记
+            current_marker = ax.scatter([], [], color=marker_color, s=80, marker='*')
+            max_marker = ax.scatter([], [], color='green', s=80, marker='s')
+            empty_text = ax.text(0.5, 0.5, "未找到有效效率数据",
+                                 ha='center', va='center', transform=ax.transAxes)
+            
+            ax.set_title(title)
+            ax.set_xlabel("电流密度 (A/cm²)")
+            ax.set_ylabel("效率 (%)")
+            ax.set_xlim(*xlim)
+            ax.set_ylim(0, 5.0)
+            ax.grid(True, linestyle='--', alpha=0.7)
+            
+            # 两个标记位置的复用缓冲区：第0行为当前电流密度，第1行为最大效率点
+            marker_xy = np.empty((2, 2), dtype=np.float64)
+            
+            self._eff_artists.append((line, points, current_marker, max_marker, empty_text, marker_xy))
+
+    def set_efficiency_data(self, index, name, currents, efficiencies, current, current_eff):
+        """更新一个效率图表的曲线、当前电流密度标记和最大效率点"""
+        ax = self.eff_axes[index]
+        line, points, current_marker, max_marker, empty_text, marker_xy = self._eff_artists[index]
+        
+        # 绘制效率曲线和数据点
+        line.set_data(currents, efficiencies)
+        points.set_offsets(np.column_stack((currents, efficiencies)))
+        
+        has_data = efficiencies.size > 0
+        empty_text.set_visible(not has_data)
+        current_marker.set_visible(has_data and current_eff > 0)
+        max_marker.set_visible(has_data)
+        
+        legend = ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        
+        if not has_data:
+            ax.set_ylim(0, 5.0)
+            return
+        
+        # 查找最大效率点
+        max_idx = np.argmax(efficiencies)
+        max_eff = efficiencies[max_idx]
+        max_j = currents[max_idx]
+        logger.debug("%s最大效率: %.4f%% 在电流密度 %.2fA/cm²", name, max_eff, max_j)
+        
+        # 标记当前选择的电流密度
+        if current_eff > 0:
+            marker_xy[0] = current, current_eff
+            current_marker.set_offsets(marker_xy[0:1])
+            current_marker.set_label(f'当前: {current}A/cm², {current_eff:.4f}%')
+        
+        # 标记最大效率点
+        marker_xy[1] = max_j, max_eff
+        max_marker.set_offsets(marker_xy[1:2])
+        max_marker.set_label(f'最大: {max_j:.2f}A/cm², {max_eff:.4f}%')
+        
+        # 设置效率范围
+        ax.set_ylim(0, max(max_eff * 1.2, 5.0))
+        ax.legend(handles=[marker for marker in (current_marker, max_marker) if marker.get_visible()],
+                  loc='best', fontsize=8)
+
+    def setup_device_axes(self):
+        """设置器件功率、器件效率和优化区间图表的坐标轴样式，并创建曲线和标记"""
+        # 器件功率
+        self.power_ax.clear()
+        power_line, = self.power_ax.plot([], [], 'b-', linewidth=1.5, label='功率曲线')
+        power_point = self.power_ax.scatter([], [], color='red', marker='o', s=50, label='最大功率点')
+        self.power_ax.set_xlabel("电流密度 (A/cm²)")
+        self.power_ax.set_ylabel("功率 (W/cm²)")
+        
+        # 器件效率
+        self.device_eff_ax.clear()
+        eff_line, = self.device_eff_ax.plot([], [], 'r-', linewidth=1.5, label='效率曲线')
+        eff_point = self.device_eff_ax.scatter([], [], color='blue', marker='o', s=50, label='最大效率点')
+        self.device_eff_ax.set_xlabel("电流密度 (A/cm²)")
+        self.device_eff_ax.set_ylabel("效率 (%)")
+        
+        for ax in (self.power_ax, self.device_eff_ax):
+            ax.grid(True, linestyle='--', alpha=0.6)
+            ax.set_facecolor('#F8F8F8')
+        
+        self._device_artists = (power_line, power_point, eff_line, eff_point)
+
+    def setup_optimization_axes(self):
+        """设置功率效率优化区间图表的坐标轴样式，并创建优化曲线和最大功率/效率点标记"""
+        self.opt_ax.clear()
+        opt_line, = self.opt_ax.plot([], [], 'g-', label='优化曲线')
+        opt_power_point = self.opt_ax.scatter([], [], color='red', marker='o', label='最大功率点')
+        opt_eff_point = self.opt_ax.scatter([], [], color='blue', marker='o', label='最大效率点')
+        self.opt_ax.set_xlabel("功率 (W/cm²)")
+        self.opt_ax.set_ylabel("效率 (%)")
+        self.opt_ax.grid(True, linestyle='--', alpha=0.6)
+        
+        self._opt_artists = (opt_line, opt_power_point, opt_eff_point)
+
+    def on_temperature_draw(self, event):
+        """温度分布图完整重绘后保存背景，并补画标注"""
+        self._temp_background = self.temp_canvas.copy_from_bbox(self.temp_canvas.figure.bbox)
+        for ax in self.temp_axes:
+            for artist in ax.texts:
+                ax.draw_artist(artist)
+
     def update_efficiency_plots(self):
         """更新效率图表，基于参考算法的计算方法"""
         try:
-            # 使用保存的引用直接访问图表
-            ax1, ax2 = self.eff_axes
-            ax1.clear()
-            ax2.clear()
-            
             # 获取输入参数
-            Th = float(self.th_edit.text())
-            Tc = float(self.tc_edit.text())
+            Th, Tc = self.input_values('_Th', '_Tc')
             p_composition = self.p_type_combo.currentText()
             n_composition = self.n_type_combo.currentText()
             
@@ -1383,132 +1701,54 @@ class ThermoelectricApp(QMainWindow):
             x_p, T_p = self.x_p, self.T_p
             x_n, T_n = self.x_n, self.T_n
             
-            # 设置与参考算法一致的电流密度范围
-            p_currents = np.linspace(-30, 0, 16)  # P型电流密度范围
-            n_currents = np.linspace(0, 50, 51)   # N型电流密度范围（0-50，步长1）
-            
-            # 计算P型效率
-            p_efficiencies = []
-            valid_p_currents = []
-            for j in p_currents:
-                eff, _ = self.calculator.calculate_efficiency(
-                    Th, Tc, 'p', p_composition, j, x_p, T_p)
-                if eff > 0:  # 只保留正效率值
-                    p_efficiencies.append(eff)
-                    valid_p_currents.append(j)
-            
-            # 计算N型效率
-            n_efficiencies = []
-            valid_n_currents = []
-            for j in n_currents:
-                eff, _ = self.calculator.calculate_efficiency(
-                    Th, Tc, 'n', n_composition, j, x_n, T_n)
-                if eff > 0:  # 只保留正效率值
-                    n_efficiencies.append(eff)
-                    valid_n_currents.append(j)
-            
-            # 计算当前电流密度的效率
+            # 输入参数和温度分布均未变时效率图不变，无需重新计算和重绘
+            cache_key = (Th, Tc, p_composition, n_composition, current_p, current_n,
+                         self._grid.tobytes())
+            if cache_key == self._eff_cache_key:
+                return
+            
+            # 首次更新时设置坐标轴并创建曲线和标记，之后只替换数据
+            if self._eff_artists is None:
+                self.setup_efficiency_axes()
+            
+            # 与参考算法一致的电流密度范围
+            p_currents = self.P_CURRENTS
+            n_currents = self.N_CURRENTS
+            
+            # 温度分布上的材料属性只求一次，供电流密度扫描和当前电流密度共用
+            p_props = self.calculator.eval_props('p', p_composition, T_p)
+            n_props = self.calculator.eval_props('n', n_composition, T_n)
+            
+            # 计算P型效率，只保留正效率值，并转为百分比供绘图使用
+            p_efficiencies, _ = self.calculator.calculate_efficiency_batch(
+                Th, Tc, 'p', p_composition, p_currents, x_p, T_p, p_props)
+            p_mask = p_efficiencies > 0
+            valid_p_currents = p_currents[p_mask]
+            p_efficiencies = p_efficiencies[p_mask] * 100
+            
+            # 计算N型效率，只保留正效率值，并转为百分比供绘图使用
+            n_efficiencies, _ = self.calculator.calculate_efficiency_batch(
+                Th, Tc, 'n', n_composition, n_currents, x_n, T_n, n_props)
+            n_mask = n_efficiencies > 0
+            valid_n_currents = n_currents[n_mask]
+            n_efficiencies = n_efficiencies[n_mask] * 100
+            
+            # 计算当前电流密度的效率 (%)
             p_current_eff, _ = self.calculator.calculate_efficiency(
-                Th, Tc, 'p', p_composition, current_p, x_p, T_p)
+                Th, Tc, 'p', p_composition, current_p, x_p, T_p, p_props)
             n_current_eff, _ = self.calculator.calculate_efficiency(
-                Th, Tc, 'n', n_composition, current_n, x_n, T_n)
-            
-            # 查找最大效率点
-            if p_efficiencies:
-                max_p_eff_idx = np.argmax(p_efficiencies)
-                max_p_eff = p_efficiencies[max_p_eff_idx]
-                max_p_j = valid_p_currents[max_p_eff_idx]
-                print(f"P型最大效率: {max_p_eff:.4f}% 在电流密度 {max_p_j:.2f}A/cm²")
-            
-            if n_efficiencies:
-                max_n_eff_idx = np.argmax(n_efficiencies)
-                max_n_eff = n_efficiencies[max_n_eff_idx]
-                max_n_j = valid_n_currents[max_n_eff_idx]
-                print(f"N型最大效率: {max_n_eff:.4f}% 在电流密度 {max_n_j:.2f}A/cm²")
-            
-            # 绘制P型效率曲线
-            if valid_p_currents:
-                ax1.plot(valid_p_currents, p_efficiencies, 'b-', linewidth=1.5)
-                ax1.scatter(valid_p_currents, p_efficiencies, color='blue', s=20, marker='o')
-                
-                # 标记当前选择的电流密度
-                if p_current_eff > 0:
-                    ax1.scatter(current_p, p_current_eff, color='red', s=80, marker='*', 
-                               label=f'当前: {current_p}A/cm², {p_current_eff:.4f}%')
-                
-                # 标记最大效率点
-                if p_efficiencies:
-                    ax1.scatter(max_p_j, max_p_eff, color='green', s=80, marker='s',
-                               label=f'最大: {max_p_j:.2f}A/cm², {max_p_eff:.4f}%')
-                
-                ax1.set_title("P型材料效率")
-                ax1.set_xlabel("电流密度 (A/cm²)")
-                ax1.set_ylabel("效率 (%)")
-                
-                # 设置P型电流密度范围，重点关注-2.5到0部分
-                ax1.set_xlim(-5, 0)
-                
-                # 设置效率范围
-                if p_efficiencies:
-                    y_max = max(p_efficiencies) * 1.2
-                    ax1.set_ylim(0, max(y_max, 5.0))
-                else:
-                    ax1.set_ylim(0, 5.0)
-                    
-                ax1.grid(True, linestyle='--', alpha=0.7)
-                ax1.legend(loc='best', fontsize=8)
-            else:
-                ax1.text(0.5, 0.5, "未找到有效效率数据", 
-                        ha='center', va='center', transform=ax1.transAxes)
-                ax1.set_title("P型材料效率")
-                ax1.set_xlabel("电流密度 (A/cm²)")
-                ax1.set_ylabel("效率 (%)")
-                ax1.set_xlim(-5, 0)
-                ax1.set_ylim(0, 5.0)
-            
-            # 绘制N型效率曲线
-            if valid_n_currents:
-                ax2.plot(valid_n_currents, n_efficiencies, 'r-', linewidth=1.5)
-                ax2.scatter(valid_n_currents, n_efficiencies, color='red', s=20, marker='o')
-                
-                # 标记当前选择的电流密度
-                if n_current_eff > 0:
-                    ax2.scatter(current_n, n_current_eff, color='blue', s=80, marker='*',
-                               label=f'当前: {current_n}A/cm², {n_current_eff:.4f}%')
-                
-                # 标记最大效率点
-                if n_efficiencies:
-                    ax2.scatter(max_n_j, max_n_eff, color='green', s=80, marker='s',
-                               label=f'最大: {max_n_j:.2f}A/cm², {max_n_eff:.4f}%')
-                
-                ax2.set_title("N型材料效率")
-                ax2.set_xlabel("电流密度 (A/cm²)")
-                ax2.set_ylabel("效率 (%)")
-                
-                # 设置N型横坐标范围为0-50
-                ax2.set_xlim(0, 50)
-                
-                # 根据计算结果设置纵坐标范围
-                if n_efficiencies:
-                    y_max = max(n_efficiencies) * 1.2
-                    ax2.set_ylim(0, max(y_max, 5.0))
-                else:
-                    ax2.set_ylim(0, 5.0)
-                    
-                ax2.grid(True, linestyle='--', alpha=0.7)
-                ax2.legend(loc='best', fontsize=8)
-            else:
-                ax2.text(0.5, 0.5, "未找到有效效率数据", 
-                        ha='center', va='center', transform=ax2.transAxes)
-                ax2.set_title("N型材料效率")
-                ax2.set_xlabel("电流密度 (A/cm²)")
-                ax2.set_ylabel("效率 (%)")
-                ax2.set_xlim(0, 50)
-                ax2.set_ylim(0, 5.0)
+                Th, Tc, 'n', n_composition, current_n, x_n, T_n, n_props)
+            p_current_eff *= 100
+            n_current_eff *= 100
+            
+            # 更新P型和N型效率曲线
+            self.set_efficiency_data(0, 'P型', valid_p_currents, p_efficiencies, current_p, p_current_eff)
+            self.set_efficiency_data(1, 'N型', valid_n_currents, n_efficiencies, current_n, n_current_eff)
             
             # 刷新图表
             self.eff_canvas.draw()
-            print("效率图更新完成")
+            self._eff_cache_key = cache_key
+            logger.debug("效率图更新完成")
             
         except Exception as e:
             print(f"更新效率图错误: {str(e)}")
@@ -1518,7 +1758,7 @@ class ThermoelectricApp(QMainWindow):
     def update_branch_characteristics(self):
         """更新分支特性"""
         try:
-            print("开始更新分支特性...")
+            logger.debug("开始更新分支特性...")
             # 更新状态指示灯为红色（计算中）
             self.calc_status.set_status(False)
             QApplication.processEvents()  # 确保UI更新
@@ -1531,7 +1771,7 @@ class ThermoelectricApp(QMainWindow):
             
             # 计算完成，更新状态指示灯为绿色
             self.calc_status.set_status(True)
-            print("分支特性更新完成")
+            logger.debug("分支特性更新完成")
             
         except Exception as e:
             print(f"更新分支特性错误: {str(e)}")
@@ -1542,195 +1782,193 @@ class ThermoelectricApp(QMainWindow):
     def calculate_device_performance(self):
         """计算器件性能"""
         try:
-            # 获取中间面板的状态指示灯
-            eff_group = self.findChild(QGroupBox, "材料效率")
-            calc_status = eff_group.findChild(StatusLight)
-            
-            # 更新状态指示灯为红色（计算中）
-            calc_status.set_status(False)
+            # 更新中间面板的状态指示灯为红色（计算中）
+            self.calc_status.set_status(False)
             QApplication.processEvents()  # 确保UI更新
             
             # 获取输入参数
-            Th = float(self.th_edit.text())
-            Tc = float(self.tc_edit.text())
+            Th, Tc, area_ratio = self.input_values('_Th', '_Tc', '_ratio')
             p_composition = self.p_type_combo.currentText()
             n_composition = self.n_type_combo.currentText()
-            area_ratio = float(self.ratio_edit.text())
             
-            print(f"\n===== 开始计算器件性能 =====")
-            print(f"温度: Th={Th}K, Tc={Tc}K")
-            print(f"材料: P型={p_composition}, N型={n_composition}")
-            print(f"面积比(N/P): {area_ratio}")
+            logger.debug("===== 开始计算器件性能 =====")
+            logger.debug("温度: Th=%sK, Tc=%sK", Th, Tc)
+            logger.debug("材料: P型=%s, N型=%s", p_composition, n_composition)
+            logger.debug("面积比(N/P): %s", area_ratio)
             
-            # 创建更合理的电流密度范围
-            currents = np.linspace(0.1, 4, 40)  # 避免从0开始（可能导致除零错误）
-            powers = []
-            efficiencies = []
+            # 电流密度范围
+            currents = self.DEV_CURRENTS
             
             # 获取当前温度分布
             x_p, T_p = self.x_p, self.T_p
             x_n, T_n = self.x_n, self.T_n
             
-            # 计算每个电流密度下的功率和效率
-            for j in currents:
-                # P型和N型的电流密度
-                j_p = -j  # P型为负
-                j_n = j / area_ratio  # 考虑面积比
-                
-                # 计算P型和N型的效率和功率
-                p_eff, p_power = self.calculator.calculate_efficiency(
-                    Th, Tc, 'p', p_composition, j_p, x_p, T_p)
-                n_eff, n_power = self.calculator.calculate_efficiency(
-                    Th, Tc, 'n', n_composition, j_n, x_n, T_n)
-                
-                # 转换为百分比和适当单位
-                p_eff = p_eff / 100  # 转回小数
-                n_eff = n_eff / 100  # 转回小数
-                
-                # 根据面积比计算综合效率和功率
-                # 假设P型和N型具有相同的热流输入密度
-                p_area = 1 / (1 + area_ratio)  # P型面积占比
-                n_area = area_ratio / (1 + area_ratio)  # N型面积占比
-                
-                # 计算总功率（考虑面积比）
-                total_power = p_power * p_area + n_power * n_area
-                
-                # 计算总效率（加权平均）
-                if p_eff > 0 and n_eff > 0:
-                    total_efficiency = (p_eff * p_area + n_eff * n_area) / (p_area + n_area)
-                else:
-                    total_efficiency = 0
-                
-                powers.append(total_power / 10000)  # 转换为W/cm²
-                efficiencies.append(total_efficiency)
-            
-            # 查找最大功率点和最大效率点
-            if powers and max(powers) > 0:
-                max_power_idx = np.argmax(powers)
+            # 一次计算所有电流密度下P型和N型的效率和功率
+            # P型电流密度为负，N型电流密度考虑面积比
+            p_eff, p_power = self.calculator.calculate_efficiency_batch(
+                Th, Tc, 'p', p_composition, -currents, x_p, T_p)
+            n_eff, n_power = self.calculator.calculate_efficiency_batch(
+                Th, Tc, 'n', n_composition, currents / area_ratio, x_n, T_n)
+            
+            # 根据面积比计算综合效率和功率
+            # 假设P型和N型具有相同的热流输入密度
+            p_area = 1 / (1 + area_ratio)  # P型面积占比
+            n_area = area_ratio / (1 + area_ratio)  # N型面积占比
+            
+            # 计算总功率（考虑面积比），转换为W/cm²
+            powers = (p_power * p_area + n_power * n_area) / 10000
+            
+            # 计算总效率（加权平均，p_area + n_area 恒为1无需归一化），任一分支效率非正时记为0
+            efficiencies = np.where((p_eff > 0) & (n_eff > 0),
+                                    p_eff * p_area + n_eff * n_area, 0.0)
+            
+            # 效率转为百分比供绘图使用
+            eff_pct = efficiencies * 100
+            
+            # 查找最大功率点和最大效率点，只扫描一次数组
+            max_power_idx = int(np.argmax(powers))
+            max_power = powers[max_power_idx]
+            max_eff_idx = int(np.argmax(efficiencies))
+            max_eff_pct = eff_pct[max_eff_idx]
+            has_power = max_power > 0
+            has_eff = max_eff_pct > 0
+            
+            if has_power:
                 self.max_power.setText(f"{powers[max_power_idx]:.2e}")
                 self.power_current.setText(f"{currents[max_power_idx]:.2f}")
-                print(f"最大功率: {powers[max_power_idx]:.4e} W/cm² 在电流密度 {currents[max_power_idx]:.2f}A/cm²")
+                logger.debug("最大功率: %.4e W/cm² 在电流密度 %.2fA/cm²", powers[max_power_idx], currents[max_power_idx])
             else:
                 self.max_power.setText("0")
                 self.power_current.setText("0")
-                print("未找到有效的最大功率点")
+                logger.debug("未找到有效的最大功率点")
             
-            if efficiencies and max(efficiencies) > 0:
-                max_eff_idx = np.argmax(efficiencies)
+            if has_eff:
                 self.max_eff.setText(f"{efficiencies[max_eff_idx]:.2%}")
                 self.eff_current.setText(f"{currents[max_eff_idx]:.2f}")
-                print(f"最大效率: {efficiencies[max_eff_idx]:.4%} 在电流密度 {currents[max_eff_idx]:.2f}A/cm²")
+                logger.debug("最大效率: %.4f%% 在电流密度 %.2fA/cm²", eff_pct[max_eff_idx], currents[max_eff_idx])
             else:
                 self.max_eff.setText("0")
                 self.eff_current.setText("0")
-                print("未找到有效的最大效率点")
+                logger.debug("未找到有效的最大效率点")
+            
+            # 保存数值结果 (最大功率, 对应电流密度, 最大效率(%), 对应电流密度)，无效时记为0
+            self._device_results = (
+                float(max_power) if has_power else 0.0,
+                float(currents[max_power_idx]) if has_power else 0.0,
+                float(max_eff_pct) if has_eff else 0.0,
+                float(currents[max_eff_idx]) if has_eff else 0.0)
+            
+            # 首次计算时设置坐标轴并创建曲线和标记，之后只替换数据
+            if self._device_artists is None:
+                self.setup_device_axes()
+            power_line, power_point, eff_line, eff_point = self._device_artists
             
             # 更新功率图
-            power_container = self.findChild(QGroupBox, "器件功率").findChildren(FigureCanvas)[0]
-            power_fig = power_container.figure
-            power_ax = power_fig.axes[0]
-            power_ax.clear()
-            power_ax.plot(currents, powers, 'b-', linewidth=1.5, label='功率曲线')
-            
-            if max(powers) > 0:
-                power_ax.scatter(currents[max_power_idx], powers[max_power_idx], 
-                               color='red', marker='o', s=50, label='最大功率点')
-            
-            power_ax.set_xlabel("电流密度 (A/cm²)")
-            power_ax.set_ylabel("功率 (W/cm²)")
-            power_ax.set_xlim(0, max(currents))
-            power_ax.set_ylim(0, max(max(powers)*1.1, 1e-6))
-            power_ax.grid(True, linestyle='--', alpha=0.6)
-            power_ax.legend(loc='best')
-            power_ax.set_facecolor('#F8F8F8')
-            power_fig.canvas.draw()
+            power_line.set_data(currents, powers)
+            power_point.set_visible(has_power)
+            if has_power:
+                power_point.set_offsets([[currents[max_power_idx], powers[max_power_idx]]])
+            
+            self.power_ax.set_xlim(0, currents.max())
+            self.power_ax.set_ylim(0, max(max_power*1.1, 1e-6))
+            self.power_ax.legend(handles=[power_line, power_point] if has_power else [power_line], loc='best')
+            self.power_canvas.draw_idle()
             
             # 更新效率图
-            eff_container = self.findChild(QGroupBox, "器件效率").findChildren(FigureCanvas)[0]
-            eff_fig = eff_container.figure
-            eff_ax = eff_fig.axes[0]
-            eff_ax.clear()
-            eff_ax.plot(currents, [e*100 for e in efficiencies], 'r-', linewidth=1.5, label='效率曲线')
-            
-            if max(efficiencies) > 0:
-                eff_ax.scatter(currents[max_eff_idx], efficiencies[max_eff_idx]*100, 
-                             color='blue', marker='o', s=50, label='最大效率点')
-            
-            eff_ax.set_xlabel("电流密度 (A/cm²)")
-            eff_ax.set_ylabel("效率 (%)")
-            eff_ax.set_xlim(0, max(currents))
-            eff_ax.set_ylim(0, max(max([e*100 for e in efficiencies])*1.1, 0.1))
-            eff_ax.grid(True, linestyle='--', alpha=0.6)
-            eff_ax.legend(loc='best')
-            eff_ax.set_facecolor('#F8F8F8')
-            eff_fig.canvas.draw()
+            eff_line.set_data(currents, eff_pct)
+            eff_point.set_visible(has_eff)
+            if has_eff:
+                eff_point.set_offsets([[currents[max_eff_idx], eff_pct[max_eff_idx]]])
+            
+            self.device_eff_ax.set_xlim(0, currents.max())
+            self.device_eff_ax.set_ylim(0, max(max_eff_pct*1.1, 0.1))
+            self.device_eff_ax.legend(handles=[eff_line, eff_point] if has_eff else [eff_line], loc='best')
+            self.device_eff_canvas.draw_idle()
             
             # 更新优化区间图
-            if powers and efficiencies and max(powers) > 0 and max(efficiencies) > 0:
-                opt_container = self.findChild(QGroupBox, "功率效率优化区间").findChildren(FigureCanvas)[0]
-                opt_fig = opt_container.figure
-                opt_ax = opt_fig.axes[0]
-                opt_ax.clear()
-                opt_ax.plot(powers, [e*100 for e in efficiencies], 'g-', label='优化曲线')
-                opt_ax.scatter(powers[max_power_idx], efficiencies[max_power_idx]*100, 
-                             color='red', marker='o', label='最大功率点')
-                opt_ax.scatter(powers[max_eff_idx], efficiencies[max_eff_idx]*100, 
-                             color='blue', marker='o', label='最大效率点')
-                opt_ax.set_xlabel("功率 (W/cm²)")
-                opt_ax.set_ylabel("效率 (%)")
-                opt_ax.grid(True, linestyle='--', alpha=0.6)
-                opt_ax.legend(loc='best')
-                opt_fig.canvas.draw()
+            if has_power and has_eff:
+                if self._opt_artists is None:
+                    self.setup_optimization_axes()
+                opt_line, opt_power_point, opt_eff_point = self._opt_artists
+                opt_line.set_data(powers, eff_pct)
+                opt_power_point.set_offsets([[powers[max_power_idx], eff_pct[max_power_idx]]])
+                opt_eff_point.set_offsets([[powers[max_eff_idx], eff_pct[max_eff_idx]]])
+                self.opt_ax.relim()
+                self.opt_ax.autoscale_view()
+                self.opt_ax.legend(loc='best')
+                self.opt_canvas.draw_idle()
             
             # 计算完成，更新状态指示灯为绿色
-            calc_status.set_status(True)
-            print("===== 器件性能计算完成 =====")
+            self.calc_status.set_status(True)
+            logger.debug("===== 器件性能计算完成 =====")
             
         except Exception as e:
             print(f"计算器件性能错误: {str(e)}")
             import traceback
             traceback.print_exc()
-            calc_status.set_status(False)
+            self.calc_status.set_status(False)
 
     def export_data(self):
         """导出数据到文件"""
         try:
             from datetime import datetime
-            import pandas as pd
             
             # 获取当前时间作为文件名
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"thermoelectric_data_{timestamp}.xlsx"
-            
-            # 创建Excel写入器
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                # 获取所有计算数据
-                data = {
-                    "高温温度(K)": [float(self.th_edit.text())],
-                    "低温温度(K)": [float(self.tc_edit.text())],
-                    "P型材料": [self.p_type_combo.currentText()],
-                    "N型材料": [self.n_type_combo.currentText()],
-                    "N/P面积比": [float(self.ratio_edit.text())],
-                    "最大功率(W/cm2)": [float(self.max_power.text())],
-                    "最大功率电流密度(A/cm2)": [float(self.power_current.text())],
-                    "最大效率": [float(self.max_eff.text())],
-                    "最大效率电流密度(A/cm2)": [float(self.eff_current.text())]
-                }
-                
-                # 创建数据帧并保存
-                df = pd.DataFrame(data)
-                df.to_excel(writer, sheet_name='计算结果', index=False)
             
-            # 确保工作表可见
-            workbook = writer.book
-            if workbook.sheetnames:
-                workbook.active = workbook.sheetnames.index('计算结果')
-        
+            # 获取所有计算数据，器件性能使用计算时保存的数值而非显示文本
+            if self._device_results is None:
+                raise ValueError("尚未计算器件性能，请先计算")
+            max_power, power_current, max_eff, eff_current = self._device_results
+            Th, Tc, ratio = self.input_values('_Th', '_Tc', '_ratio')
+            data = {
+                "高温温度(K)": Th,
+                "低温温度(K)": Tc,
+                "P型材料": self.p_type_combo.currentText(),
+                "N型材料": self.n_type_combo.currentText(),
+                "N/P面积比": ratio,
+                "最大功率(W/cm2)": max_power,
+                "最大功率电流密度(A/cm2)": power_current,
+                "最大效率(%)": max_eff,
+                "最大效率电流密度(A/cm2)": eff_current
+            }
+            
+            # 只有一行数据：第一行为表头，第二行为数值
+            try:
+                from openpyxl import Workbook
+            except ImportError:
+                # openpyxl未安装时导出为CSV文件
+                import csv
+                filename = f"thermoelectric_data_{timestamp}.csv"
+                with open(filename, 'w', newline='', encoding='utf-8-sig') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(data.keys())
+                    writer.writerow(data.values())
+            else:
+                # 以只写模式直接写入工作表
+                filename = f"thermoelectric_data_{timestamp}.xlsx"
+                workbook = Workbook(write_only=True)
+                sheet = workbook.create_sheet('计算结果')
+                sheet.append(list(data.keys()))
+                sheet.append(list(data.values()))
+                workbook.save(filename)
+            
             print(f"数据已导出到文件: {filename}")
             
         except Exception as e:
             print(f"导出数据错误: {str(e)}")
 
+    def analysis_figure(self, kind, title, figsize):
+        """获取指定分析类型的图窗口并清空其图表，同一类型重复分析时复用同一窗口"""
+        dialog = self._analysis_dialogs.get(kind)
+        if dialog is None:
+            dialog = FigureDialog(title, figsize, self)
+            self._analysis_dialogs[kind] = dialog
+        else:
+            dialog.setWindowTitle(title)
+        dialog.figure.clear()
+        return dialog
+
     def analyze_material_performance(self, material_type, composition, current_density):
         """分析材料性能并可视化结果，帮助查找问题"""
         try:
@@ -1739,10 +1977,13 @@ class ThermoelectricApp(QMainWindow):
                 return
                 
             data = self.last_calc_data
+            title = f"{material_type}型材料 (组分={composition}, 电流密度={current_density}A/cm²) 性能分析"
             
-            # 创建一个2x2的可视化图表
-            fig, axes = plt.subplots(2, 2, figsize=(12, 10))
-            fig.suptitle(f"{material_type}型材料 (组分={composition}, 电流密度={current_density}A/cm²) 性能分析", fontsize=14)
+            # 创建一个2x2的可视化图表，重复分析时复用同一窗口
+            dialog = self.analysis_figure('material_performance', title, (12, 10))
+            fig = dialog.figure
+            axes = fig.subplots(2, 2)
+            fig.suptitle(title, fontsize=14)
             
             # 1. 温度分布
             ax1 = axes[0, 0]
@@ -1774,10 +2015,11 @@ class ThermoelectricApp(QMainWindow):
             ax3 = axes[1, 0]
             seebeck_power = data['seebeck'] * data['dTdx'] * data['current_density']
             joule_heat = data['resistivity'] * data['current_density']**2
+            net_power = seebeck_power - joule_heat
             
             ax3.plot(x_range, seebeck_power, 'b-', label='塞贝克功率')
             ax3.plot(x_range, joule_heat, 'r-', label='焦耳热损失')
-            ax3.plot(x_range, seebeck_power - joule_heat, 'g-', label='净功率')
+            ax3.plot(x_range, net_power, 'g-', label='净功率')
             ax3.set_title('能量流动分析')
             ax3.set_xlabel('格点位置')
             ax3.set_ylabel('功率密度 (W/m³)')
@@ -1786,44 +2028,64 @@ class ThermoelectricApp(QMainWindow):
             
             # 4. 热流分析
             ax4 = axes[1, 1]
+            # 电流密度为标量，原地乘入避免多余的临时数组；净热流只算一次，供绘图和能量平衡共用
             fourier_heat = data['thermal_cond'] * data['dTdx']
-            peltier_heat = data['current_density'] * data['seebeck'] * data['temperature']
+            peltier_heat = data['seebeck'] * data['temperature']
+            peltier_heat *= data['current_density']
+            net_heat = fourier_heat - peltier_heat
             ax4.plot(x_range, fourier_heat, 'b-', label='傅里叶热流')
             ax4.plot(x_range, peltier_heat, 'r-', label='帕尔贴热流')
-            ax4.plot(x_range, fourier_heat - peltier_heat, 'g-', label='净热流')
+            ax4.plot(x_range, net_heat, 'g-', label='净热流')
             ax4.set_title('热流分析')
             ax4.set_xlabel('格点位置')
             ax4.set_ylabel('热流密度 (W/m²)')
             ax4.grid(True)
             ax4.legend()
             
-            plt.tight_layout()
-            plt.show()
-            
-            # 打印能量平衡分析
-            print("\n===== 能量平衡分析 =====")
-            heat_in = abs(fourier_heat[0] - peltier_heat[0])
-            heat_out = abs(fourier_heat[-1] - peltier_heat[-1])
-            total_joule = np.sum(joule_heat) * (x_range[-1] - x_range[0]) / (len(x_range) - 1)
-            total_power = np.sum(seebeck_power - joule_heat) * (x_range[-1] - x_range[0]) / (len(x_range) - 1)
+            dialog.refresh()
             
-            print(f"入口热流: {heat_in:.3e} W/m²")
-            print(f"出口热流: {heat_out:.3e} W/m²")
-            print(f"总焦耳热: {total_joule:.3e} W/m²")
-            print(f"总功率输出: {total_power:.3e} W/m²")
-            print(f"热平衡差值: {(heat_in - heat_out - total_power):.3e} W/m² (理论上应接近0)")
+            # 输出能量平衡分析，积分只在调试输出开启时计算
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("===== 能量平衡分析 =====")
+                heat_in = abs(net_heat[0])
+                heat_out = abs(net_heat[-1])
+                total_joule = trapezoid(joule_heat, x_range)
+                total_power = trapezoid(net_power, x_range)
+                
+                logger.debug("入口热流: %.3e W/m²", heat_in)
+                logger.debug("出口热流: %.3e W/m²", heat_out)
+                logger.debug("总焦耳热: %.3e W/m²", total_joule)
+                logger.debug("总功率输出: %.3e W/m²", total_power)
+                logger.debug("热平衡差值: %.3e W/m² (理论上应接近0)", heat_in - heat_out - total_power)
             
         except Exception as e:
             print(f"性能分析错误: {str(e)}")
             import traceback
             traceback.print_exc()
 
+    def efficiency_curve_data(self, Th, Tc, material_type, composition, currents, x, T):
+        """
+        计算效率曲线分析所需的数据，只保留正效率值，结果按参数和温度分布缓存
+        
+        返回:
+        (valid_currents, efficiencies, powers): 有效电流密度 (A/cm²)、效率 (%) 和功率 (W/m²)
+        """
+        key = (Th, Tc, material_type, composition, currents.tobytes(), np.asarray(T).tobytes())
+        if key not in self._eff_curve_cache:
+            efficiencies, powers = self.calculator.calculate_efficiency_batch(
+                Th, Tc, material_type, composition, currents, x, T)
+            mask = efficiencies > 0  # 只保留正效率值
+            if len(self._eff_curve_cache) >= 64:
+                # 缓存过多时丢弃最早的结果
+                self._eff_curve_cache.pop(next(iter(self._eff_curve_cache)))
+            self._eff_curve_cache[key] = (currents[mask], efficiencies[mask] * 100, powers[mask])
+        return self._eff_curve_cache[key]
+
     def analyze_efficiency_curve(self, material_type, composition):
         """分析材料效率曲线，帮助调试和对比论文结果"""
         try:
             # 获取温度设置
-            Th = float(self.th_edit.text())
-            Tc = float(self.tc_edit.text())
+            Th, Tc = self.input_values('_Th', '_Tc')
             
             # 获取温度分布
             x = self.x_p if material_type == 'p' else self.x_n
@@ -1837,75 +2099,67 @@ class ThermoelectricApp(QMainWindow):
                 currents = np.linspace(20.0, 50.0, 31)  # N型范围
                 title = f"N型材料 ({composition}) 效率曲线分析"
             
-            # 计算效率
-            efficiencies = []
-            powers = []
-            valid_currents = []
+            # 计算效率，相同参数和温度分布下直接使用缓存结果
+            valid_currents, efficiencies, powers = self.efficiency_curve_data(
+                Th, Tc, material_type, composition, currents, x, T)
             
-            for j in currents:
-                eff, power = self.calculator.calculate_efficiency(
-                    Th, Tc, material_type, composition, j, x, T)
-                if eff > 0:  # 只保留正效率值
-                    efficiencies.append(eff)
-                    powers.append(power)
-                    valid_currents.append(j)
-            
-            # 创建图表
-            plt.figure(figsize=(10, 6))
-            plt.plot(valid_currents, efficiencies, 'bo-', linewidth=1.5, markersize=4)
+            # 创建图表，每种材料类型复用同一窗口
+            dialog = self.analysis_figure(f'efficiency_curve_{material_type}', title, (10, 6))
+            fig = dialog.figure
+            ax = fig.add_subplot()
+            ax.plot(valid_currents, efficiencies, 'bo-', linewidth=1.5, markersize=4)
             
             # 添加最大效率点
-            if efficiencies:
+            if efficiencies.size:
                 max_idx = np.argmax(efficiencies)
-                plt.scatter(valid_currents[max_idx], efficiencies[max_idx], color='red', s=100, marker='*')
-                plt.annotate(f'最大效率: {efficiencies[max_idx]:.4f}%\n电流密度: {valid_currents[max_idx]:.2f}A/cm²', 
+                ax.scatter(valid_currents[max_idx], efficiencies[max_idx], color='red', s=100, marker='*')
+                ax.annotate(f'最大效率: {efficiencies[max_idx]:.4f}%\n电流密度: {valid_currents[max_idx]:.2f}A/cm²', 
                             xy=(valid_currents[max_idx], efficiencies[max_idx]),
                             xytext=(valid_currents[max_idx] + 0.1, efficiencies[max_idx] - 0.002),
                             arrowprops=dict(arrowstyle='->'))
             
             # 设置图表属性
-            plt.title(title)
-            plt.xlabel("电流密度 (A/cm²)")
-            plt.ylabel("效率 (%)")
-            plt.grid(True, linestyle='--', alpha=0.7)
+            ax.set_title(title)
+            ax.set_xlabel("电流密度 (A/cm²)")
+            ax.set_ylabel("效率 (%)")
+            ax.grid(True, linestyle='--', alpha=0.7)
             
             # 设置坐标轴范围，与论文图7.2对应
             if material_type == 'p':
-                plt.xlim(-2.5, 0.0)
+                ax.set_xlim(-2.5, 0.0)
             else:
-                plt.xlim(20.0, 50.0)
+                ax.set_xlim(20.0, 50.0)
                 
-            if efficiencies:
-                plt.ylim(0, max(efficiencies) * 1.1)
+            if efficiencies.size:
+                ax.set_ylim(0, efficiencies.max() * 1.1)
             else:
-                plt.ylim(0, 0.05)  # 默认范围0-5%
+                ax.set_ylim(0, 0.05)  # 默认范围0-5%
             
             # 添加注释信息
-            plt.figtext(0.02, 0.02, f"温度设置: Th={Th}K, Tc={Tc}K", fontsize=9)
+            fig.text(0.02, 0.02, f"温度设置: Th={Th}K, Tc={Tc}K", fontsize=9)
             
             # 添加卡诺效率参考线
             carnot_eff = (Th - Tc) / Th * 100
-            plt.axhline(y=carnot_eff, color='r', linestyle='--', alpha=0.5)
-            plt.annotate(f'卡诺效率: {carnot_eff:.2f}%', 
-                        xy=(valid_currents[0] if valid_currents else currents[0], carnot_eff),
-                        xytext=(valid_currents[0] if valid_currents else currents[0], carnot_eff + 0.002),
+            ax.axhline(y=carnot_eff, color='r', linestyle='--', alpha=0.5)
+            ax.annotate(f'卡诺效率: {carnot_eff:.2f}%', 
+                        xy=(valid_currents[0] if valid_currents.size else currents[0], carnot_eff),
+                        xytext=(valid_currents[0] if valid_currents.size else currents[0], carnot_eff + 0.002),
                         fontsize=8)
             
-            plt.tight_layout()
-            plt.show()
+            dialog.refresh()
             
-            # 打印数据统计
-            print(f"\n======= {title} =======")
-            print(f"温度设置: Th={Th}K, Tc={Tc}K")
-            print(f"卡诺效率: {carnot_eff:.4f}%")
+            # 输出数据统计
+            logger.debug("======= %s =======", title)
+            logger.debug("温度设置: Th=%sK, Tc=%sK", Th, Tc)
+            logger.debug("卡诺效率: %.4f%%", carnot_eff)
             
-            if efficiencies:
+            if efficiencies.size:
                 max_idx = np.argmax(efficiencies)
-                print(f"最大效率: {efficiencies[max_idx]:.4f}% 在电流密度 {valid_currents[max_idx]:.2f}A/cm²")
-                print(f"效率值范围: {min(efficiencies):.4f}% - {max(efficiencies):.4f}%")
-                print(f"相对卡诺效率: {(max(efficiencies)/carnot_eff*100):.2f}%")
+                logger.debug("最大效率: %.4f%% 在电流密度 %.2fA/cm²", efficiencies[max_idx], valid_currents[max_idx])
+                logger.debug("效率值范围: %.4f%% - %.4f%%", efficiencies.min(), efficiencies.max())
+                logger.debug("相对卡诺效率: %.2f%%", efficiencies.max() / carnot_eff * 100)
             else:
-                print("未找到有效效率数据")
+                logger.debug("未找到有效效率数据")
             
         except Exception as e:
             print(f"效率曲线分析错误: {str(e)}")
@@ -1918,6 +2172,11 @@ class ThermoelectricApp(QMainWindow):
         self.p_current_combo.addItems(["-2.5", "-2.0", "-1.5", "-1.0", "-0.5"])
 
 if __name__ == '__main__':
+    # 默认只输出警告，使用 -v 参数运行时输出详细的计算过程
+    # 根日志保持WARNING，只打开本模块的调试输出，避免matplotlib等库的调试信息混入
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    if '-v' in sys.argv[1:]:
+        logger.setLevel(logging.DEBUG)
     app = QApplication(sys.argv)
     window = ThermoelectricApp()
     window.show()